@@ -2,9 +2,10 @@
 V2 Animation - Wave controller and animation utilities
 """
 
-from .wave_controller import WaveController, WaveConfig
+from .wave_controller import DEFAULT_DT, WaveController, WaveConfig
 
 __all__ = [
+    "DEFAULT_DT",
     "WaveController",
     "WaveConfig",
 ]
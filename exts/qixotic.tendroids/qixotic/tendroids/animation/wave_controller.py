@@ -10,6 +10,10 @@ import random
 from dataclasses import dataclass
 from enum import Enum
 
+# Frame step assumed when an update event carries no "dt" (60 fps);
+# shared by every controller so their fallbacks cannot drift apart
+DEFAULT_DT = 1.0 / 60.0
+
 
 class WavePhase(Enum):
     """Wave cycle phases."""
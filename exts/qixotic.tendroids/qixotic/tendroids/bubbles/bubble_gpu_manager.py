@@ -61,6 +61,9 @@ class BubbleGPUManager:
         self.pop_heights_gpu = wp.zeros(max_bubbles, dtype=float, device=device)
         self.max_diameter_heights_gpu = wp.zeros(max_bubbles, dtype=float, device=device)
         self.max_radii_gpu = wp.zeros(max_bubbles, dtype=float, device=device)
+        
+        # Host-side [N, 3] positions filled by get_bubble_states() each frame
+        self._world_positions_np = np.empty((max_bubbles, 3), dtype=np.float32)
     
     def register_bubble(
         self,
@@ -295,16 +298,18 @@ class BubbleGPUManager:
         Returns:
             (phases, world_positions, radii) as numpy arrays
             phases: [N] int array
-            world_positions: [N, 3] float array  
+            world_positions: [N, 3] float array, a reused buffer that the
+                next call overwrites (copy it to keep values)
             radii: [N] float array
         """
         phases = self.phases_gpu.numpy()
         
-        wx = self.world_x_gpu.numpy()
-        wy = self.world_y_gpu.numpy()
-        wz = self.world_z_gpu.numpy()
+        # Columns written into the preallocated buffer, no per-frame stack
+        world_positions = self._world_positions_np
+        world_positions[:, 0] = self.world_x_gpu.numpy()
+        world_positions[:, 1] = self.world_y_gpu.numpy()
+        world_positions[:, 2] = self.world_z_gpu.numpy()
         
-        world_positions = np.stack([wx, wy, wz], axis=-1)
         radii = self.current_radius_gpu.numpy()
         
         return phases, world_positions, radii
@@ -331,3 +336,4 @@ class BubbleGPUManager:
         ]
         for attr in arrays:
             setattr(self, attr, None)
+        self._world_positions_np = None
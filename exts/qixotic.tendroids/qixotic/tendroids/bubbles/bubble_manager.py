@@ -558,10 +558,10 @@ class _BubbleState:
                 UsdGeom.Imageable(self.sphere_prim).MakeVisible()
     
     def destroy(self):
-        if self.stage and self.prim_path:
-            prim = self.stage.GetPrimAtPath(self.prim_path)
-            if prim.IsValid():
-                self.stage.RemovePrim(self.prim_path)
+        # Reuse the prim handle from _create_visual instead of a path lookup
+        prim = self.sphere_prim
+        if self.stage and prim and prim.IsValid():
+            self.stage.RemovePrim(prim.GetPath())
         self.sphere_prim = None
         self.translate_op = None
         self.scale_op = None
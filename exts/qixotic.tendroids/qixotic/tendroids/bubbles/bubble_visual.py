@@ -29,6 +29,8 @@ class V2BubbleVisual:
         self._visual_scale = 0.95  # 95% of logic radius for wall gap
         self._base_radius = 1.0   # Mesh created at this radius, scaled dynamically
         self._opacity = opacity   # Configurable opacity
+        self._last_y = None       # Last values written, to skip no-op Sets
+        self._last_scale = None
         
     def create(self, initial_radius: float, start_y: float):
         """Create the visual bubble sphere with vertex-down orientation."""
@@ -61,17 +63,23 @@ class V2BubbleVisual:
         
         self._translate_op.Set(Gf.Vec3d(0.0, start_y, 0.0))
         self._scale_op.Set(Gf.Vec3f(1.0, 1.0, 1.0))
+        self._last_y = start_y
+        self._last_scale = 1.0
         
     def update(self, y_position: float, current_radius: float):
         """Update visual position and size via scale transform."""
         try:
-            if self._translate_op:
+            if self._translate_op and y_position != self._last_y:
                 self._translate_op.Set(Gf.Vec3d(0.0, y_position, 0.0))
+                self._last_y = y_position
             
             if self._scale_op and self._base_radius > 0:
-                # Scale relative to base radius for dynamic size changes
-                scale_factor = (current_radius * self._visual_scale) / (self._base_radius * self._visual_scale)
-                self._scale_op.Set(Gf.Vec3f(scale_factor, scale_factor, scale_factor))
+                # Scale relative to base radius (visual_scale cancels out);
+                # radius holds steady at max for much of the rise
+                scale_factor = current_radius / self._base_radius
+                if scale_factor != self._last_scale:
+                    self._scale_op.Set(Gf.Vec3f(scale_factor, scale_factor, scale_factor))
+                    self._last_scale = scale_factor
                 
         except Exception as e:
             carb.log_warn(f"[V2BubbleVisual] Update error: {e}")
@@ -82,10 +90,13 @@ class V2BubbleVisual:
     
     def destroy(self):
         """Remove the visual from the stage."""
-        if self._stage and self._path:
-            prim = self._stage.GetPrimAtPath(self._path)
+        # Reuse the prim handle from create() instead of a path lookup
+        if self._stage and self._mesh:
+            prim = self._mesh.GetPrim()
             if prim.IsValid():
-                self._stage.RemovePrim(self._path)
+                self._stage.RemovePrim(prim.GetPath())
         self._mesh = None
         self._translate_op = None
         self._scale_op = None
+        self._last_y = None
+        self._last_scale = None
@@ -19,6 +19,9 @@ class PopParticleVisual:
     Physics handled by GPU manager.
     """
     
+    # One instance per live particle: no per-instance __dict__
+    __slots__ = ('stage', 'prim_path', 'prim', 'translate_op')
+    
     def __init__(self, stage, prim_path: str, position: tuple, radius: float):
         """
         Create particle visual.
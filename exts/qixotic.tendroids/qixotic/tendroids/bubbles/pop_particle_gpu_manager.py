@@ -5,9 +5,6 @@ Manages pop particle physics using Warp kernels for parallel processing.
 Handles spawning, physics updates, and state synchronization.
 """
 
-import math
-import random
-
 import numpy as np
 import warp as wp
 
@@ -52,6 +49,9 @@ class PopParticleGPUManager:
         # Free slot tracking (CPU side)
         self.free_slots = list(range(max_particles))
         self.active_slots = set()
+        
+        # Spray directions and lifetimes are drawn per burst, not per particle
+        self._rng = np.random.default_rng()
     
     def get_active_count(self) -> int:
         """Return number of active particles."""
@@ -100,25 +100,17 @@ class PopParticleGPUManager:
         spawn_pos_y = np.full(actual_count, pop_position[1], dtype=np.float32)
         spawn_pos_z = np.full(actual_count, pop_position[2], dtype=np.float32)
         
-        spawn_vel_x = np.zeros(actual_count, dtype=np.float32)
-        spawn_vel_y = np.zeros(actual_count, dtype=np.float32)
-        spawn_vel_z = np.zeros(actual_count, dtype=np.float32)
-        spawn_lifetimes = np.zeros(actual_count, dtype=np.float32)
+        # Generate random velocities for all particles at once
+        rng = self._rng
+        angle = rng.uniform(0.0, 2.0 * np.pi, actual_count)
+        elevation = np.radians(rng.uniform(-particle_spread / 2, particle_spread, actual_count))
+        horizontal = particle_speed * np.cos(elevation)
         
-        # Generate random velocities for each particle
-        for i in range(actual_count):
-            angle = random.uniform(0, 2 * math.pi)
-            elevation = random.uniform(-particle_spread / 2, particle_spread)
-            
-            spray_vx = particle_speed * math.cos(angle) * math.cos(math.radians(elevation))
-            spray_vy = particle_speed * math.sin(math.radians(elevation))
-            spray_vz = particle_speed * math.sin(angle) * math.cos(math.radians(elevation))
-            
-            spawn_vel_x[i] = bubble_velocity[0] + spray_vx
-            spawn_vel_y[i] = bubble_velocity[1] + spray_vy
-            spawn_vel_z[i] = bubble_velocity[2] + spray_vz
-            
-            spawn_lifetimes[i] = base_lifetime * random.uniform(0.7, 1.3)
+        spawn_vel_x = (bubble_velocity[0] + horizontal * np.cos(angle)).astype(np.float32)
+        spawn_vel_y = (bubble_velocity[1] + particle_speed * np.sin(elevation)).astype(np.float32)
+        spawn_vel_z = (bubble_velocity[2] + horizontal * np.sin(angle)).astype(np.float32)
+        
+        spawn_lifetimes = (base_lifetime * rng.uniform(0.7, 1.3, actual_count)).astype(np.float32)
         
         # Upload spawn data to GPU
         indices_gpu = wp.array(spawned_indices, dtype=int, device=self.device)
@@ -208,12 +200,13 @@ class PopParticleGPUManager:
         if not self.active_slots:
             return {}
         
-        positions = self.get_positions()
-        # Convert numpy.float32 to Python float for USD compatibility
-        return {
-            idx: (float(positions[idx][0]), float(positions[idx][1]), float(positions[idx][2]))
-            for idx in self.active_slots
-        }
+        # Gather each SoA column once for the active slots; tolist()
+        # converts numpy.float32 to Python float for USD compatibility
+        slots = np.fromiter(self.active_slots, dtype=np.int64, count=len(self.active_slots))
+        xs = self.pos_x_gpu.numpy()[slots].tolist()
+        ys = self.pos_y_gpu.numpy()[slots].tolist()
+        zs = self.pos_z_gpu.numpy()[slots].tolist()
+        return dict(zip(slots.tolist(), zip(xs, ys, zs)))
     
     def clear_all(self) -> list:
         """
@@ -7,12 +7,17 @@ have pole topology at top/bottom; rotating 90 degrees around X-axis
 puts smooth quad geometry at the bottom instead.
 """
 
+import functools
 import math
-from pxr import Gf, UsdGeom
 
+import numpy as np
+from pxr import UsdGeom, Vt
 
-def _rotate_around_x_axis(x: float, y: float, z: float, angle: float) -> tuple:
-    """Rotate a point around the X-axis by given angle in radians."""
+from ..builders.cylinder_generator import CylinderGenerator
+
+
+def _rotate_around_x_axis(x, y, z, angle: float) -> tuple:
+    """Rotate points around the X-axis by given angle in radians."""
     cos_a = math.cos(angle)
     sin_a = math.sin(angle)
     new_y = y * cos_a - z * sin_a
@@ -20,6 +25,36 @@ def _rotate_around_x_axis(x: float, y: float, z: float, angle: float) -> tuple:
     return x, new_y, new_z
 
 
+@functools.lru_cache(maxsize=8)
+def _unit_sphere(
+    horizontal_segments: int,
+    vertical_segments: int,
+    vertex_down: bool
+) -> np.ndarray:
+    """Unit sphere normals, cached per resolution and shared by every bubble."""
+    # Latitude angle from top pole (0) to bottom pole (pi)
+    phi = np.arange(vertical_segments + 1) * (math.pi / vertical_segments)
+    # One unit ring of longitude samples, shared by every latitude
+    ring_x, ring_z = CylinderGenerator.ring_table(horizontal_segments)
+    
+    # Each latitude ring is the unit ring scaled by sin(phi)
+    sin_phi = np.sin(phi)[:, None]
+    nx = sin_phi * ring_x
+    ny = np.broadcast_to(np.cos(phi)[:, None], nx.shape)
+    nz = sin_phi * ring_z
+    
+    # Rotation: 90 degrees around X-axis puts equator at bottom
+    if vertex_down:
+        nx, ny, nz = _rotate_around_x_axis(nx, ny, nz, math.pi / 2.0)
+    
+    normals = np.empty((nx.size, 3), dtype=np.float32)
+    normals[:, 0] = nx.ravel()
+    normals[:, 1] = ny.ravel()
+    normals[:, 2] = nz.ravel()
+    normals.flags.writeable = False
+    return normals
+
+
 def create_uv_sphere_points(
     radius: float,
     horizontal_segments: int = 16,
@@ -36,44 +71,11 @@ def create_uv_sphere_points(
         vertex_down: If True, rotate 90° so equator vertex points down
     
     Returns:
-        Tuple of (points, normals) as lists of Gf.Vec3f
+        Tuple of (points, normals) as (N, 3) float32 numpy arrays; normals
+        are cached per resolution and shared, so they are read-only
     """
-    points = []
-    normals = []
-    
-    # Rotation angle: 90 degrees around X-axis puts equator at bottom
-    rotation_angle = (math.pi / 2.0) if vertex_down else 0.0
-    
-    for v in range(vertical_segments + 1):
-        # Latitude angle from top pole (0) to bottom pole (pi)
-        phi = (v / vertical_segments) * math.pi
-        
-        sin_phi = math.sin(phi)
-        cos_phi = math.cos(phi)
-        
-        for h in range(horizontal_segments):
-            # Longitude angle around the sphere
-            theta = (h / horizontal_segments) * 2.0 * math.pi
-            
-            sin_theta = math.sin(theta)
-            cos_theta = math.cos(theta)
-            
-            # Unit sphere coordinates (Y-up, poles on Y-axis)
-            nx = sin_phi * cos_theta
-            ny = cos_phi
-            nz = sin_phi * sin_theta
-            
-            # Apply rotation if vertex-down mode
-            if vertex_down:
-                nx, ny, nz = _rotate_around_x_axis(nx, ny, nz, rotation_angle)
-            
-            # Scale by radius for position
-            x = radius * nx
-            y = radius * ny
-            z = radius * nz
-            
-            points.append(Gf.Vec3f(x, y, z))
-            normals.append(Gf.Vec3f(nx, ny, nz))
+    normals = _unit_sphere(horizontal_segments, vertical_segments, vertex_down)
+    points = normals * np.float32(radius)
     
     return points, normals
 
@@ -85,30 +87,45 @@ def create_sphere_face_indices(
     """
     Generate face indices for UV sphere mesh.
     
+    The latitude/longitude grid has the same ring-major layout as a
+    cylinder, so the cached cylinder topology is reused as-is.
+    
     Args:
         horizontal_segments: Longitude divisions
         vertical_segments: Latitude divisions
     
     Returns:
-        Tuple of (face_vertex_counts, face_vertex_indices)
+        Tuple of (face_vertex_counts, face_vertex_indices) as read-only
+        int32 NumPy arrays
     """
-    face_vertex_counts = []
-    face_vertex_indices = []
-    
-    for v in range(vertical_segments):
-        for h in range(horizontal_segments):
-            # Current ring vertex indices
-            v0 = v * horizontal_segments + h
-            v1 = v * horizontal_segments + ((h + 1) % horizontal_segments)
-            # Next ring vertex indices
-            v2 = (v + 1) * horizontal_segments + ((h + 1) % horizontal_segments)
-            v3 = (v + 1) * horizontal_segments + h
-            
-            # Two triangles per quad
-            face_vertex_counts.extend([3, 3])
-            face_vertex_indices.extend([v0, v2, v1, v0, v3, v2])
+    return CylinderGenerator.create_face_indices(
+        radial_segments=horizontal_segments,
+        height_segments=vertical_segments
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _sphere_vt_buffers(
+    horizontal_segments: int,
+    vertical_segments: int,
+    vertex_down: bool
+) -> tuple:
+    """
+    Radius-independent Vt arrays (normals, face counts, face indices).
     
-    return face_vertex_counts, face_vertex_indices
+    VtArrays are copy-on-write, so every bubble mesh can share one set
+    instead of converting the same NumPy buffers on each spawn.
+    """
+    normals = _unit_sphere(horizontal_segments, vertical_segments, vertex_down)
+    face_counts, face_indices = create_sphere_face_indices(
+        horizontal_segments=horizontal_segments,
+        vertical_segments=vertical_segments
+    )
+    return (
+        Vt.Vec3fArray.FromNumpy(normals),
+        Vt.IntArray.FromNumpy(face_counts),
+        Vt.IntArray.FromNumpy(face_indices),
+    )
 
 
 def create_sphere_mesh(
@@ -133,16 +150,16 @@ def create_sphere_mesh(
     Returns:
         UsdGeom.Mesh prim
     """
-    points, normals = create_uv_sphere_points(
+    points, _ = create_uv_sphere_points(
         radius=radius,
         horizontal_segments=horizontal_segments,
         vertical_segments=vertical_segments,
         vertex_down=vertex_down
     )
+    points = Vt.Vec3fArray.FromNumpy(points)
     
-    face_counts, face_indices = create_sphere_face_indices(
-        horizontal_segments=horizontal_segments,
-        vertical_segments=vertical_segments
+    normals, face_counts, face_indices = _sphere_vt_buffers(
+        horizontal_segments, vertical_segments, vertex_down
     )
     
     mesh_prim = UsdGeom.Mesh.Define(stage, path)
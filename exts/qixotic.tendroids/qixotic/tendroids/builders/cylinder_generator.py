@@ -5,8 +5,51 @@ Creates cylinder geometry with configurable flare at the base
 for realistic sea floor attachment.
 """
 
+import functools
 import math
-from pxr import Gf, UsdGeom, Sdf
+
+import numpy as np
+from pxr import UsdGeom, Sdf, Vt
+
+
+@functools.lru_cache(maxsize=8)
+def _ring_table(radial_segments: int) -> tuple:
+    """Unit-circle (cos, sin) samples shared by every cylinder with this resolution."""
+    # Rotate by the step angle with the angle-addition recurrence, kept as
+    # a complex cumprod: one sincos per ring instead of one per vertex.
+    # float64 drift stays ~1e-15 at these segment counts
+    step = 2.0 * math.pi / radial_segments
+    ring = np.empty(radial_segments, dtype=np.complex128)
+    ring[0] = 1.0
+    ring[1:] = complex(math.cos(step), math.sin(step))
+    np.cumprod(ring, out=ring)
+    cos_a = ring.real.copy()
+    sin_a = ring.imag.copy()
+    cos_a.flags.writeable = False
+    sin_a.flags.writeable = False
+    return cos_a, sin_a
+
+
+@functools.lru_cache(maxsize=8)
+def _build_topology(radial_segments: int, height_segments: int) -> tuple:
+    """Triangle topology for a (height_segments, radial_segments) cylinder grid."""
+    # Quad corners on the (H, R) grid; two triangles per quad
+    h = np.arange(height_segments, dtype=np.int32)[:, None]
+    r = np.arange(radial_segments, dtype=np.int32)[None, :]
+    r_next = (r + 1) % radial_segments
+    v0 = h * radial_segments + r
+    v1 = h * radial_segments + r_next
+    v2 = (h + 1) * radial_segments + r_next
+    v3 = (h + 1) * radial_segments + r
+
+    face_vertex_indices = np.stack(
+        [v0, v2, v1, v0, v3, v2], axis=-1
+    ).ravel().astype(np.int32)
+    face_vertex_counts = np.full(2 * height_segments * radial_segments, 3, dtype=np.int32)
+
+    face_vertex_counts.flags.writeable = False
+    face_vertex_indices.flags.writeable = False
+    return face_vertex_counts, face_vertex_indices
 
 
 class CylinderGenerator:
@@ -39,45 +82,57 @@ class CylinderGenerator:
         
         Returns:
             Tuple of (points, normals, heights, deform_start_height)
-            - points: List of Gf.Vec3f vertices
-            - normals: List of Gf.Vec3f normals
-            - heights: List of Y values per vertex
+            - points: (N, 3) float32 array of vertices
+            - normals: (N, 3) float32 array of normals
+            - heights: (N,) float32 array of Y values per vertex
             - deform_start_height: Y where flare ends (deformation can begin)
         """
-        points = []
-        normals = []
-        heights = []
-        
         flare_height = length * (flare_height_percent / 100.0)
         max_flare_radius = radius * flare_radius_multiplier
         
-        for h in range(height_segments + 1):
-            y = (h / height_segments) * length
-            
-            # Calculate radius at this height (flared at base)
-            if y < flare_height:
-                # Smooth flare using cosine interpolation
-                t = y / flare_height
-                flare_factor = 0.5 * (1.0 - math.cos(t * math.pi))
-                current_radius = max_flare_radius + (radius - max_flare_radius) * flare_factor
-            else:
-                current_radius = radius
-            
-            for r in range(radial_segments):
-                angle = (r / radial_segments) * 2.0 * math.pi
-                cos_a = math.cos(angle)
-                sin_a = math.sin(angle)
-                
-                x = current_radius * cos_a
-                z = current_radius * sin_a
-                
-                points.append(Gf.Vec3f(x, y, z))
-                normals.append(Gf.Vec3f(cos_a, 0.0, sin_a))
-                heights.append(y)
+        # Ring heights and radii, flared at base via cosine interpolation.
+        # Clamping t to 1 above the flare gives flare_factor == 1 there, so
+        # one expression covers both regions without a mask
+        y = np.arange(height_segments + 1, dtype=np.float64) * (length / height_segments)
+        if flare_height > 0.0:
+            t = np.minimum(y / flare_height, 1.0)
+        else:
+            t = np.ones_like(y)
+        flare_factor = 0.5 * (1.0 - np.cos(t * np.pi))
+        ring_radius = max_flare_radius + (radius - max_flare_radius) * flare_factor
+        
+        cos_a, sin_a = _ring_table(radial_segments)
+        
+        # Build the (H+1, R, 3) grid in one shot, ring-major like the face indices
+        shape = (height_segments + 1, radial_segments)
+        points = np.empty(shape + (3,), dtype=np.float32)
+        points[..., 0] = np.outer(ring_radius, cos_a)
+        points[..., 1] = y[:, None]
+        points[..., 2] = np.outer(ring_radius, sin_a)
+        
+        normals = np.zeros(shape + (3,), dtype=np.float32)
+        normals[..., 0] = cos_a
+        normals[..., 2] = sin_a
+        
+        heights = np.repeat(y.astype(np.float32), radial_segments)
         
         deform_start_height = flare_height
         
-        return points, normals, heights, deform_start_height
+        return points.reshape(-1, 3), normals.reshape(-1, 3), heights, deform_start_height
+    
+    @staticmethod
+    def ring_table(radial_segments: int) -> tuple:
+        """
+        Unit-circle samples around the circumference.
+        
+        Args:
+            radial_segments: Vertices around circumference
+        
+        Returns:
+            Tuple of (cos, sin) float64 NumPy arrays, cached per segment
+            count and shared, so they are read-only
+        """
+        return _ring_table(radial_segments)
     
     @staticmethod
     def create_face_indices(
@@ -92,23 +147,11 @@ class CylinderGenerator:
             height_segments: Vertical divisions
         
         Returns:
-            Tuple of (face_vertex_counts, face_vertex_indices)
+            Tuple of (face_vertex_counts, face_vertex_indices) as int32
+            NumPy arrays, ready for Vt.IntArray.FromNumpy. The arrays are
+            cached per segment count and shared, so they are read-only.
         """
-        face_vertex_counts = []
-        face_vertex_indices = []
-        
-        for h in range(height_segments):
-            for r in range(radial_segments):
-                v0 = h * radial_segments + r
-                v1 = h * radial_segments + ((r + 1) % radial_segments)
-                v2 = (h + 1) * radial_segments + ((r + 1) % radial_segments)
-                v3 = (h + 1) * radial_segments + r
-                
-                # Two triangles per quad
-                face_vertex_counts.extend([3, 3])
-                face_vertex_indices.extend([v0, v2, v1, v0, v3, v2])
-        
-        return face_vertex_counts, face_vertex_indices
+        return _build_topology(radial_segments, height_segments)
     
     @staticmethod
     def create_mesh(
@@ -152,25 +195,32 @@ class CylinderGenerator:
             height_segments=height_segments
         )
         
-        # Create USD mesh
+        # Hand contiguous float32 buffers straight to Vt
+        points = Vt.Vec3fArray.FromNumpy(points)
+        normals = Vt.Vec3fArray.FromNumpy(normals)
+        
+        # Compute extent
+        extent = UsdGeom.PointBased.ComputeExtent(points)
+        
+        # Create USD mesh. Define stays outside the change block so the
+        # prim is composed; the attribute authoring below is coalesced
+        # into a single change notification
         mesh_prim = UsdGeom.Mesh.Define(stage, path)
-        mesh_prim.CreatePointsAttr(points)
-        mesh_prim.CreateNormalsAttr(normals)
-        mesh_prim.SetNormalsInterpolation(UsdGeom.Tokens.vertex)
-        mesh_prim.CreateFaceVertexCountsAttr(face_counts)
-        mesh_prim.CreateFaceVertexIndicesAttr(face_indices)
-        mesh_prim.CreateSubdivisionSchemeAttr("none")
-        mesh_prim.CreateDoubleSidedAttr(True)
-        
-        # Compute and set extent
-        extent = UsdGeom.PointBased(mesh_prim).ComputeExtent(points)
-        mesh_prim.CreateExtentAttr(extent)
-        
-        # Add "Deformable" tag for Fabric GPU rendering
-        # This tells OmniHydra to render points directly from Fabric
-        # instead of USD, enabling zero-copy GPU deformation
         prim = mesh_prim.GetPrim()
-        if not prim.HasAttribute("Deformable"):
-            prim.CreateAttribute("Deformable", Sdf.ValueTypeNames.Token, True)
+        with Sdf.ChangeBlock():
+            mesh_prim.CreatePointsAttr(points)
+            mesh_prim.CreateNormalsAttr(normals)
+            mesh_prim.SetNormalsInterpolation(UsdGeom.Tokens.vertex)
+            mesh_prim.CreateFaceVertexCountsAttr(Vt.IntArray.FromNumpy(face_counts))
+            mesh_prim.CreateFaceVertexIndicesAttr(Vt.IntArray.FromNumpy(face_indices))
+            mesh_prim.CreateSubdivisionSchemeAttr("none")
+            mesh_prim.CreateDoubleSidedAttr(True)
+            mesh_prim.CreateExtentAttr(extent)
+            
+            # Add "Deformable" tag for Fabric GPU rendering
+            # This tells OmniHydra to render points directly from Fabric
+            # instead of USD, enabling zero-copy GPU deformation
+            if not prim.HasAttribute("Deformable"):
+                prim.CreateAttribute("Deformable", Sdf.ValueTypeNames.Token, True)
         
         return mesh_prim, points, deform_start
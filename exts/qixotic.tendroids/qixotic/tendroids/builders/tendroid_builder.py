@@ -5,7 +5,7 @@ Handles USD geometry creation, terrain conforming, and Warp deformer initializat
 """
 
 import carb
-from pxr import Gf, UsdGeom
+from pxr import Gf, UsdGeom, Vt
 
 from .cylinder_generator import CylinderGenerator
 from .terrain_conform import conform_base_to_terrain
@@ -121,8 +121,8 @@ class V2TendroidBuilder:
           height_segments=height_segments,
           get_height_fn=get_height_fn
         )
-        mesh_prim.GetPointsAttr().Set(conformed_points)
-        points = conformed_points
+        points = Vt.Vec3fArray.FromNumpy(conformed_points)
+        mesh_prim.GetPointsAttr().Set(points)
 
       # Apply material
       apply_material(stage, mesh_prim)
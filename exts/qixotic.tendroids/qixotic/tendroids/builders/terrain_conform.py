@@ -5,82 +5,63 @@ Adjusts base flare vertices to follow sea floor terrain contours.
 """
 
 import math
-from pxr import Gf
+
+import numpy as np
 
 
 def conform_base_to_terrain(
-    vertices: list,
+    vertices,
     base_position: tuple,
     flare_height: float,
     radial_segments: int,
     height_segments: int,
     get_height_fn
-) -> list:
+) -> np.ndarray:
     """
     Adjust base vertices to conform to terrain height.
     
     Args:
-        vertices: List of Gf.Vec3f vertices
+        vertices: (N, 3) vertices (NumPy array or Vt.Vec3fArray)
         base_position: (x, y, z) world position of tendroid base
         flare_height: Height of flare section
         radial_segments: Number of vertices per ring
         height_segments: Total vertical segments
-        get_height_fn: Function(x, z) -> height to query terrain
+        get_height_fn: Function(x, z) -> height to query terrain; called
+            once with arrays of the flare vertices' world x/z
     
     Returns:
-        Modified vertex list with terrain-conforming base
+        (N, 3) float32 array with terrain-conforming base
     """
-    if not vertices or radial_segments <= 0:
-        return vertices
+    modified_vertices = np.array(vertices, dtype=np.float32).reshape(-1, 3)
+    if len(modified_vertices) == 0 or radial_segments <= 0:
+        return modified_vertices
     
     # Calculate segment height
-    total_height = vertices[-1][1] if vertices else 0
+    total_height = float(modified_vertices[-1, 1])
     segment_height = total_height / height_segments if height_segments > 0 else 1.0
     
     # Calculate which segments are in the flare zone
     flare_segments = int(math.ceil(flare_height / segment_height)) if segment_height > 0 else 0
     flare_segments = min(flare_segments, height_segments)
     
-    # Convert to mutable list
-    modified_vertices = [Gf.Vec3f(v) for v in vertices]
+    # Rows of the flare zone, sampled in a single terrain query
+    flare_count = min((flare_segments + 1) * radial_segments, len(modified_vertices))
+    flare = modified_vertices[:flare_count]
+    world_x = flare[:, 0] + base_position[0]
+    world_z = flare[:, 2] + base_position[2]
+    terrain_offset = np.asarray(
+        get_height_fn(world_x, world_z), dtype=np.float64
+    ) - base_position[1]
+    
+    # Blend factor: bottom = full conform, top of flare = no conform,
+    # quadratic falloff for smooth transition
+    if flare_segments > 0:
+        blend = 1.0 - np.arange(flare_segments + 1) / flare_segments
+        blend = blend * blend
+    else:
+        blend = np.zeros(1)
+    ring_blend = np.repeat(blend, radial_segments)[:flare_count]
     
-    # Process each ring in the flare zone
-    for seg_idx in range(flare_segments + 1):
-        ring_start = seg_idx * radial_segments
-        
-        # Blend factor: bottom = full conform, top of flare = no conform
-        if flare_segments > 0:
-            blend = 1.0 - (seg_idx / flare_segments)
-            blend = blend * blend  # Quadratic falloff for smooth transition
-        else:
-            blend = 0.0
-        
-        # For each vertex in the ring
-        for i in range(radial_segments):
-            vert_idx = ring_start + i
-            if vert_idx >= len(vertices):
-                break
-                
-            local_vert = vertices[vert_idx]
-            
-            # Convert to world coordinates
-            world_x = base_position[0] + local_vert[0]
-            world_z = base_position[2] + local_vert[2]
-            
-            # Query terrain height at this position
-            terrain_height = get_height_fn(world_x, world_z)
-            
-            # Calculate terrain offset relative to base
-            original_y = local_vert[1]
-            terrain_offset = terrain_height - base_position[1]
-            
-            # Apply terrain height with blend
-            final_y = original_y + (terrain_offset * blend)
-            
-            modified_vertices[vert_idx] = Gf.Vec3f(
-                local_vert[0],
-                final_y,
-                local_vert[2]
-            )
+    flare[:, 1] += (terrain_offset * ring_blend).astype(np.float32)
     
     return modified_vertices
@@ -6,6 +6,7 @@ import carb
 import omni.usd
 import omni.kit.app
 
+from ..animation import DEFAULT_DT
 from ..core import V2Tendroid, V2Deformer
 from ..bubbles import V2Bubble, V2BubbleVisual
 
@@ -27,6 +28,7 @@ class V2Controller:
         self._update_sub = None
         self._running = False
         self._stage = None
+        self._frame_refs = None  # Pre-bound per-frame callables, see _bind_frame_refs
         
         self.cylinder_radius = 10.0
         self.cylinder_length = 200.0
@@ -90,6 +92,17 @@ class V2Controller:
             max_bulge_amplitude=amplitude,
             bulge_width=1.2
         )
+        self._bind_frame_refs()
+    
+    def _bind_frame_refs(self):
+        """Resolve bound methods once so _on_update only touches locals."""
+        visual, tendroid = self._bubble_visual, self.tendroid
+        self._frame_refs = (
+            self.bubble,
+            visual.update if visual else None,
+            tendroid.apply_deformation if tendroid else None,
+            self.deformer,
+        )
     
     def _start_update_loop(self):
         """Start the per-frame update subscription."""
@@ -108,6 +121,7 @@ class V2Controller:
     def clear(self):
         """Clear all V2 objects from the scene."""
         self.stop()
+        self._frame_refs = None
         if self.tendroid:
             self.tendroid.destroy()
             self.tendroid = None
@@ -129,21 +143,22 @@ class V2Controller:
     
     def _on_update(self, event):
         """Per-frame update callback."""
-        if not self._running or not self.bubble:
+        refs = self._frame_refs
+        if not self._running or refs is None:
             return
+        bubble, update_visual, apply_deformation, deformer = refs
         
-        dt = event.payload.get("dt", 1.0 / 60.0)
+        dt = event.payload.get("dt", DEFAULT_DT)
         
-        still_active = self.bubble.update(dt)
+        still_active = bubble.update(dt)
         if not still_active:
-            self.bubble.reset()
+            bubble.reset()
         
-        current_radius = self.bubble.get_current_radius()
+        bubble_y = bubble.y
+        current_radius = bubble.get_current_radius()
         
-        if self._bubble_visual:
-            self._bubble_visual.update(self.bubble.y, current_radius)
+        if update_visual:
+            update_visual(bubble_y, current_radius)
         
-        if self.tendroid and self.deformer:
-            self.tendroid.apply_deformation(
-                self.deformer, self.bubble.y, current_radius
-            )
+        if apply_deformation and deformer:
+            apply_deformation(deformer, bubble_y, current_radius)
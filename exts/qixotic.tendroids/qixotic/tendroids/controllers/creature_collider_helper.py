@@ -218,12 +218,16 @@ def update_contact_offsets(
       carb.log_error("[CreatureCollider] PhysxCollisionAPI not found on prim")
       return False
 
+    # Both offsets land in one change notification
+    with Sdf.ChangeBlock():
+      if contact_offset is not None:
+        physx_api.GetContactOffsetAttr().Set(contact_offset)
+      if rest_offset is not None:
+        physx_api.GetRestOffsetAttr().Set(rest_offset)
+
     if contact_offset is not None:
-      physx_api.GetContactOffsetAttr().Set(contact_offset)
       carb.log_info(f"[CreatureCollider] Updated contactOffset: {contact_offset}")
-
     if rest_offset is not None:
-      physx_api.GetRestOffsetAttr().Set(rest_offset)
       carb.log_info(f"[CreatureCollider] Updated restOffset: {rest_offset}")
 
     return True
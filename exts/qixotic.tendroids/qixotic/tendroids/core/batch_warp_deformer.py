@@ -7,8 +7,10 @@ in a single kernel launch. Eliminates per-tendroid kernel overhead.
 
 import numpy as np
 import warp as wp
+from pxr import UsdGeom, Vt
 
 from .batch_deform_kernel import batch_deform_kernel
+from ..utils import FabricHelper
 
 wp.init()
 
@@ -44,11 +46,29 @@ class BatchWarpDeformer:
         self.max_amplitude_gpu = None
         self.bulge_width_gpu = None
         
-        # CPU staging (reused)
+        # Host staging (reused): pinned Warp arrays + NumPy views into them
+        self._host_staging = None
+        self._upload_event = None
         self._bubble_y_cpu = None
         self._bubble_radius_cpu = None
         self._wave_dx_cpu = None
         self._wave_dz_cpu = None
+        self._out_host = None
+        self._out_host_np = None
+        self._out_host_views = None
+        self._out_gpu_views = None
+        self._pos_y_cpu = None
+        self._cyl_radius_cpu = None
+        self._spatial_cpu = None
+        self._prev_params_cpu = None
+        self._changed = None
+        
+        # Per-tendroid points attributes, resolved once instead of per frame
+        self._usd_points_attrs = None
+        self._fabric_points_attrs = None
+        self._fabric_mesh_paths = None
+        self._fabric_missing = None
+        self._fabric_stage_id = None
         self._built = False
     
     def register_tendroid(self, tendroid, base_points: list):
@@ -72,22 +92,23 @@ class BatchWarpDeformer:
             return
         n_tendroids = len(self.tendroids)
         
-        all_base_points = []
-        all_height_factors = []
-        all_tendroid_ids = []
+        # One device buffer per attribute; each tendroid's already-uploaded
+        # arrays are copied into their slice on the device, no host round-trip
+        self.base_points_gpu = wp.empty(self.total_vertices, dtype=wp.vec3, device=self.device)
+        self.height_factors_gpu = wp.empty(self.total_vertices, dtype=float, device=self.device)
         
         for i, tendroid in enumerate(self.tendroids):
             deformer = tendroid.deformer
-            base_pts = deformer.base_points_gpu.numpy()
-            height_facs = deformer.height_factors_gpu.numpy()
-            for j in range(len(base_pts)):
-                all_base_points.append(tuple(base_pts[j]))
-                all_height_factors.append(float(height_facs[j]))
-                all_tendroid_ids.append(i)
-        
-        self.base_points_gpu = wp.array(all_base_points, dtype=wp.vec3, device=self.device)
+            offset = self.vertex_offsets[i]
+            count = self.vertex_counts[i]
+            wp.copy(self.base_points_gpu, deformer.base_points_gpu, dest_offset=offset, count=count)
+            wp.copy(self.height_factors_gpu, deformer.height_factors_gpu, dest_offset=offset, count=count)
+        
+        all_tendroid_ids = np.repeat(
+            np.arange(n_tendroids, dtype=np.int32), self.vertex_counts
+        )
+        
         self.out_points_gpu = wp.zeros(self.total_vertices, dtype=wp.vec3, device=self.device)
-        self.height_factors_gpu = wp.array(all_height_factors, dtype=float, device=self.device)
         self.vertex_tendroid_ids_gpu = wp.array(all_tendroid_ids, dtype=int, device=self.device)
         
         cyl_radii = [t.radius for t in self.tendroids]
@@ -101,10 +122,57 @@ class BatchWarpDeformer:
         self.wave_dx_gpu = wp.zeros(n_tendroids, dtype=float, device=self.device)
         self.wave_dz_gpu = wp.zeros(n_tendroids, dtype=float, device=self.device)
         
-        self._bubble_y_cpu = np.zeros(n_tendroids, dtype=np.float32)
-        self._bubble_radius_cpu = np.array(cyl_radii, dtype=np.float32)
-        self._wave_dx_cpu = np.zeros(n_tendroids, dtype=np.float32)
-        self._wave_dz_cpu = np.zeros(n_tendroids, dtype=np.float32)
+        # Pinned host buffers let wp.copy upload asynchronously into the
+        # persistent device arrays instead of allocating new ones per frame.
+        # The copies only read them later on the stream, so update_states
+        # waits on _upload_event (recorded after the copies) before refilling
+        pinned = wp.get_device(self.device).is_cuda
+        self._host_staging = [
+            wp.zeros(n_tendroids, dtype=float, device="cpu", pinned=pinned)
+            for _ in range(4)
+        ]
+        self._upload_event = wp.Event(self.device) if pinned else None
+        (self._bubble_y_cpu, self._bubble_radius_cpu,
+         self._wave_dx_cpu, self._wave_dz_cpu) = [h.numpy() for h in self._host_staging]
+        self._bubble_radius_cpu[:] = cyl_radii
+        
+        # Reused pinned download target for the deformed points
+        self._out_host = wp.zeros(
+            self.total_vertices, dtype=wp.vec3, device="cpu", pinned=pinned
+        )
+        self._out_host_np = self._out_host.numpy()
+        # Per-tendroid (count, 3) views, built once instead of sliced per frame
+        self._out_host_views = [
+            self._out_host_np[offset:offset + count]
+            for offset, count in zip(self.vertex_offsets, self.vertex_counts)
+        ]
+        # On CUDA, Fabric can read per-tendroid slices of the device output
+        # directly (__cuda_array_interface__), skipping the host download;
+        # apply_to_meshes_fabric syncs the stream before handing them over
+        self._out_gpu_views = [
+            self.out_points_gpu[offset:offset + count]
+            for offset, count in zip(self.vertex_offsets, self.vertex_counts)
+        ] if pinned else None
+        
+        # Per-tendroid constants as SoA arrays for vectorized update_states
+        positions = np.array([t.position for t in self.tendroids], dtype=np.float32)
+        self._pos_y_cpu = positions[:, 1].copy()
+        self._cyl_radius_cpu = np.array(cyl_radii, dtype=np.float32)
+        
+        # Wave spatial variation depends only on (fixed) position
+        self._spatial_cpu = (
+            1.0 + np.sin(positions[:, 0] * 0.003 + positions[:, 2] * 0.002) * 0.15
+        ).astype(np.float32)
+        
+        # Last uploaded parameters per tendroid; NaN forces the first write
+        self._prev_params_cpu = np.full((4, n_tendroids), np.nan, dtype=np.float32)
+        self._changed = np.ones(n_tendroids, dtype=bool)
+        
+        self._usd_points_attrs = [
+            UsdGeom.Mesh(t.mesh_prim).GetPointsAttr()
+            if getattr(t, 'mesh_prim', None) else None
+            for t in self.tendroids
+        ]
         self._built = True
     
     def update_states(self, bubble_data: dict, wave_state: dict, default_config):
@@ -118,40 +186,68 @@ class BatchWarpDeformer:
         wave_dx = wave_state.get('dir_x', 0.0)
         wave_dz = wave_state.get('dir_z', 0.0)
         
-        for i, tendroid in enumerate(self.tendroids):
-            name = tendroid.name
-            bubble_y = 0.0
-            bubble_radius = tendroid.radius
-            
-            if name in bubble_data:
-                data = bubble_data[name]
-                if data['phase'] in (1, 2):
-                    bubble_y = data['position'][1] - tendroid.position[1]
-                    bubble_radius = data['radius'] * default_config.diameter_multiplier
-            
-            self._bubble_y_cpu[i] = bubble_y
-            self._bubble_radius_cpu[i] = bubble_radius
-            
-            if wave_enabled:
-                t_x, t_z = tendroid.position[0], tendroid.position[2]
-                spatial = 1.0 + np.sin(t_x * 0.003 + t_z * 0.002) * 0.15
-                d = wave_disp * spatial
-                self._wave_dx_cpu[i] = d * wave_amp * wave_dx
-                self._wave_dz_cpu[i] = d * wave_amp * wave_dz
-            else:
-                self._wave_dx_cpu[i] = 0.0
-                self._wave_dz_cpu[i] = 0.0
-        
-        # Direct array assignment (Warp handles this efficiently)
-        self.bubble_y_gpu = wp.array(self._bubble_y_cpu, dtype=float, device=self.device)
-        self.bubble_radius_gpu = wp.array(self._bubble_radius_cpu, dtype=float, device=self.device)
-        self.wave_dx_gpu = wp.array(self._wave_dx_cpu, dtype=float, device=self.device)
-        self.wave_dz_gpu = wp.array(self._wave_dz_cpu, dtype=float, device=self.device)
+        # Last frame's async uploads must have read the staging buffers
+        # before they are overwritten
+        if self._upload_event is not None:
+            wp.synchronize_event(self._upload_event)
+        
+        # Idle defaults for every tendroid, then overwrite those with a bubble
+        self._bubble_y_cpu.fill(0.0)
+        self._bubble_radius_cpu[:] = self._cyl_radius_cpu
+        name_to_index = self.name_to_index
+        diameter_multiplier = default_config.diameter_multiplier
+        for name, data in bubble_data.items():
+            i = name_to_index.get(name)
+            if i is not None and data['phase'] in (1, 2):
+                self._bubble_y_cpu[i] = data['position'][1] - self._pos_y_cpu[i]
+                self._bubble_radius_cpu[i] = data['radius'] * diameter_multiplier
+        
+        if wave_enabled:
+            spatial = self._spatial_cpu
+            np.multiply(spatial, wave_disp * wave_amp * wave_dx, out=self._wave_dx_cpu)
+            np.multiply(spatial, wave_disp * wave_amp * wave_dz, out=self._wave_dz_cpu)
+        else:
+            self._wave_dx_cpu.fill(0.0)
+            self._wave_dz_cpu.fill(0.0)
+        
+        # Tendroids whose inputs are identical to last frame produce identical
+        # points, so the mesh writes can skip them
+        changed = self._changed
+        changed.fill(False)
+        current = (self._bubble_y_cpu, self._bubble_radius_cpu,
+                   self._wave_dx_cpu, self._wave_dz_cpu)
+        for cur, prev in zip(current, self._prev_params_cpu):
+            changed |= cur != prev
+            prev[:] = cur
+        
+        # Upload into the existing device arrays (no per-frame allocation)
+        bubble_y_host, bubble_radius_host, wave_dx_host, wave_dz_host = self._host_staging
+        wp.copy(self.bubble_y_gpu, bubble_y_host)
+        wp.copy(self.bubble_radius_gpu, bubble_radius_host)
+        wp.copy(self.wave_dx_gpu, wave_dx_host)
+        wp.copy(self.wave_dz_gpu, wave_dz_host)
+        if self._upload_event is not None:
+            wp.get_stream(self.device).record_event(self._upload_event)
     
-    def deform_all(self):
-        """Launch single kernel to deform ALL vertices."""
+    def deform_all(self, download: bool = True):
+        """
+        Launch single kernel to deform ALL vertices.
+        
+        Args:
+            download: Copy the result to host and return it. The Fabric
+                write path reads out_points_gpu itself, so it passes False
+                to avoid a second device-to-host copy per frame.
+                The returned array is a view of a reused host buffer and
+                is overwritten by the next download.
+        
+        Skipped (returns None) when no tendroid's inputs changed since
+        the last update_states().
+        """
         if not self._built:
             return None
+        if not self._changed.any():
+            # out_points_gpu still holds last frame's (identical) result
+            return None
         wp.launch(
             kernel=batch_deform_kernel,
             dim=self.total_vertices,
@@ -165,65 +261,124 @@ class BatchWarpDeformer:
             ],
             device=self.device
         )
-        return self.out_points_gpu.numpy()
+        return self._download_points() if download else None
+    
+    def _download_points(self) -> np.ndarray:
+        """Copy out_points_gpu into the reused pinned host buffer and return its view."""
+        wp.copy(self._out_host, self.out_points_gpu)
+        wp.synchronize_device(self.device)
+        return self._out_host_np
     
     def apply_to_meshes(self, all_points: np.ndarray):
         """Apply deformed points to USD meshes - CPU PATH."""
         if all_points is None:
             return
-        from pxr import Vt, UsdGeom
         
-        for i, tendroid in enumerate(self.tendroids):
-            offset = self.vertex_offsets[i]
-            count = self.vertex_counts[i]
-            # numpy tolist() is C-optimized, much faster than per-element conversion
-            points_tuples = all_points[offset:offset + count].tolist()
-            
-            if hasattr(tendroid, 'mesh_prim') and tendroid.mesh_prim:
-                mesh = UsdGeom.Mesh(tendroid.mesh_prim)
-                mesh.GetPointsAttr().Set(Vt.Vec3fArray(points_tuples))
+        if all_points is self._out_host_np:
+            views = self._out_host_views
+        else:
+            views = [
+                all_points[offset:offset + count]
+                for offset, count in zip(self.vertex_offsets, self.vertex_counts)
+            ]
+        
+        for i in np.flatnonzero(self._changed):
+            points_attr = self._usd_points_attrs[i]
+            if points_attr:
+                # Contiguous float32 rows: FromNumpy is a single memcpy, no
+                # intermediate Python list of floats
+                points_np = np.ascontiguousarray(views[i], dtype=np.float32)
+                points_attr.Set(Vt.Vec3fArray.FromNumpy(points_np))
     
     def apply_to_meshes_fabric(self, stage_id):
         """Apply deformed points via Fabric - GPU PATH (FAST)."""
         if not self._built:
             return
         
-        from usdrt import Vt
-        from ..utils import FabricHelper
+        RtVt = FabricHelper.get_usdrt_vt()
         
-        # Get USDRT stage (cached)
-        usdrt_stage = FabricHelper.get_usdrt_stage(stage_id)
+        if self._fabric_stage_id != stage_id:
+            self._resolve_fabric_points(stage_id)
+        elif self._fabric_missing:
+            self._resolve_missing_fabric_points()
         
-        # CRITICAL: Do ONE GPU→CPU transfer for all vertices
-        # Multiple numpy() calls create GPU sync points causing stuttering
-        all_points_cpu = self.out_points_gpu.numpy()
+        if not self._changed.any():
+            return
         
-        # Apply to each tendroid mesh
-        for i, tendroid in enumerate(self.tendroids):
-            offset = self.vertex_offsets[i]
-            count = self.vertex_counts[i]
+        if self._out_gpu_views is not None:
+            # Zero-copy: device views go to Fabric as-is, no GPU→CPU transfer.
+            # usdrt reads them without knowing Warp's stream, so the deform
+            # kernel must be finished first (one sync per frame)
+            wp.synchronize_stream(wp.get_stream(self.device))
+            views = self._out_gpu_views
+        else:
+            # CRITICAL: Do ONE GPU→CPU transfer for all vertices
+            # Multiple numpy() calls create GPU sync points causing stuttering;
+            # the pinned target is reused so no per-frame host allocation either
+            self._download_points()
+            views = self._out_host_views
+        
+        # Apply to each tendroid mesh whose inputs changed
+        for i in np.flatnonzero(self._changed):
+            points_attr = self._fabric_points_attrs[i]
+            if not points_attr:
+                continue
+            
+            # Precomputed view into the device output or downloaded buffer
+            tendroid_points = views[i]
             
+            # Write to Fabric - VtArray constructor accepts Warp/numpy arrays
+            # directly, no tolist() needed
+            points_attr.Set(RtVt.Vec3fArray(tendroid_points))
+    
+    def _resolve_fabric_points(self, stage_id):
+        """Look up each tendroid's Fabric points attribute for this stage."""
+        # Get USDRT stage (cached)
+        usdrt_stage = FabricHelper.get_usdrt_stage(stage_id)
+        
+        paths = []
+        for tendroid in self.tendroids:
             # Get mesh path
             if hasattr(tendroid, 'mesh_path'):
-                mesh_path = tendroid.mesh_path
+                paths.append(tendroid.mesh_path)
             elif hasattr(tendroid, 'mesh_prim') and tendroid.mesh_prim:
-                mesh_path = str(tendroid.mesh_prim.GetPath())
+                paths.append(str(tendroid.mesh_prim.GetPath()))
             else:
-                continue
-            
-            # Get Fabric points attribute
-            points_attr = FabricHelper.get_fabric_points_attribute(
-                usdrt_stage, mesh_path
+                paths.append(None)
+        
+        self._fabric_mesh_paths = paths
+        self._fabric_points_attrs = [
+            FabricHelper.get_fabric_points_attribute(usdrt_stage, path) if path else None
+            for path in paths
+        ]
+        # Prims not in Fabric yet are retried each frame until they appear
+        self._fabric_missing = [
+            i for i, (path, attr) in enumerate(zip(paths, self._fabric_points_attrs))
+            if path and not attr
+        ]
+        self._fabric_stage_id = stage_id
+        
+        # The new stage has none of our points yet: write every tendroid now,
+        # and make the next update_states see all inputs as changed
+        self._changed.fill(True)
+        self._prev_params_cpu.fill(np.nan)
+    
+    def _resolve_missing_fabric_points(self):
+        """Retry the lookup for tendroids whose prims were not in Fabric yet."""
+        usdrt_stage = FabricHelper.get_usdrt_stage(self._fabric_stage_id)
+        still_missing = []
+        for i in self._fabric_missing:
+            attr = FabricHelper.get_fabric_points_attribute(
+                usdrt_stage, self._fabric_mesh_paths[i]
             )
-            if not points_attr:
-                continue
-            
-            # Extract slice from CPU numpy array (no GPU sync!)
-            tendroid_points = all_points_cpu[offset:offset + count]
-            
-            # Write to Fabric - VtArray constructor accepts numpy directly
-            # No tolist() needed - numpy is passed as-is
-            points_attr.Set(Vt.Vec3fArray(tendroid_points))
+            if attr:
+                self._fabric_points_attrs[i] = attr
+                # Its current points were never written; do it this frame
+                self._changed[i] = True
+                self._prev_params_cpu[:, i] = np.nan
+            else:
+                still_missing.append(i)
+        self._fabric_missing = still_missing
     
     def reset(self):
         """Reset to pre-build state."""
@@ -243,8 +398,16 @@ class BatchWarpDeformer:
                      'wave_dx_gpu', 'wave_dz_gpu', 'cylinder_radius_gpu',
                      'cylinder_length_gpu', 'max_amplitude_gpu', 'bulge_width_gpu']:
             setattr(self, attr, None)
+        self._host_staging = self._upload_event = None
         self._bubble_y_cpu = self._bubble_radius_cpu = None
         self._wave_dx_cpu = self._wave_dz_cpu = None
+        self._out_host = self._out_host_np = self._out_host_views = None
+        self._out_gpu_views = None
+        self._pos_y_cpu = self._cyl_radius_cpu = self._spatial_cpu = None
+        self._prev_params_cpu = self._changed = None
+        self._usd_points_attrs = self._fabric_points_attrs = None
+        self._fabric_mesh_paths = self._fabric_missing = None
+        self._fabric_stage_id = None
     
     @property
     def is_built(self) -> bool:
@@ -9,6 +9,7 @@ equals cylinder diameter, full deformation at max bubble diameter.
 import math
 
 import carb
+import numpy as np
 
 
 class V2Deformer:
@@ -70,3 +71,50 @@ class V2Deformer:
     gaussian = math.exp(-(dist * dist) / (2.0 * sigma * sigma))
 
     return current_amplitude * gaussian
+
+  def vectorized_displacement(
+    self,
+    vertex_heights: np.ndarray,
+    bubble_y: float,
+    bubble_radius: float,
+    out: np.ndarray = None
+  ) -> np.ndarray:
+    """
+    Calculate radial displacement for many vertices at once.
+
+    Same Gaussian as calculate_displacement(), evaluated over an array.
+
+    Args:
+        vertex_heights: float32 array of vertex Y positions
+        bubble_y: Current Y position of bubble center
+        bubble_radius: Current radius of the bubble
+        out: Optional float32 array (same shape) to write into, so
+            per-frame callers avoid allocating
+
+    Returns:
+        float32 array of displacement fractions, one per height
+    """
+    if out is None:
+      out = np.empty_like(vertex_heights)
+
+    max_radius = self.cylinder_radius * (1.0 + self.max_amplitude)
+    radius_range = max_radius - self.cylinder_radius
+
+    if radius_range <= 0:
+      out.fill(0.0)
+      return out
+
+    growth_factor = (bubble_radius - self.cylinder_radius) / radius_range
+    growth_factor = max(0.0, min(1.0, growth_factor))
+
+    current_amplitude = np.float32(self.max_amplitude * growth_factor)
+    sigma = bubble_radius * self.bulge_width
+    neg_inv_two_sigma_sq = np.float32(-1.0 / (2.0 * sigma * sigma))
+
+    # Gaussian evaluated in place: no temporaries
+    np.subtract(vertex_heights, np.float32(bubble_y), out=out)
+    np.square(out, out=out)
+    np.multiply(out, neg_inv_two_sigma_sq, out=out)
+    np.exp(out, out=out)
+    np.multiply(out, current_amplitude, out=out)
+    return out
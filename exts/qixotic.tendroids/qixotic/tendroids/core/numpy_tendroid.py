@@ -6,10 +6,41 @@ import math
 
 import carb
 import numpy as np
-from pxr import Gf, Usd, UsdGeom, Vt
+from pxr import Usd, UsdGeom, Vt
 
+from ..builders.cylinder_generator import CylinderGenerator
 from ..utils import apply_material
 
+try:
+  from numba import njit, prange
+  NUMBA_AVAILABLE = True
+except ImportError:
+  NUMBA_AVAILABLE = False
+
+
+# Rings further than this many sigmas from the bubble get scale 1
+# (Gaussian below exp(-8) ~ 3e-4) and are left at their base shape
+BAND_SIGMAS = 4.0
+
+# Bubble inputs are quantized to this step; frames whose quantized
+# (bubble_y, bubble_radius) match the previous one skip deformation
+PARAM_QUANTUM = 0.1
+
+
+if NUMBA_AVAILABLE:
+  # nogil: the kernel touches only NumPy buffers, so other Python threads
+  # (Kit UI, async tasks) keep running while it executes
+  @njit(parallel=True, fastmath=True, cache=True, nogil=True)
+  def _deform_kernel(base, heights, out, row_lo, row_hi, bubble_y, sigma, current_amp):
+    """Fused per-ring Gaussian bulge over rows [row_lo, row_hi); (H+1, R, 3)."""
+    inv_two_sigma_sq = 1.0 / (2.0 * sigma * sigma)
+    for h in prange(row_lo, row_hi):
+      dist = heights[h] - bubble_y
+      s = 1.0 + current_amp * math.exp(-dist * dist * inv_two_sigma_sq)
+      for r in range(base.shape[1]):
+        out[h, r, 0] = base[h, r, 0] * s
+        out[h, r, 2] = base[h, r, 2] * s
+
 
 class V2NumpyTendroid:
   """
@@ -34,55 +65,73 @@ class V2NumpyTendroid:
 
     self.base_points_np = None
     self.vertex_heights = None
-    self.out_points = None
+    self.unique_heights = None
+    self.out_points_f32 = None
+    self._base_rings = None
+    self._out_rings = None
+    self._scratch = None
+    self._radius_range = radius * max_amplitude
+    self._prev_band = (0, 0)  # rows deformed last frame, [lo, hi)
+    self._last_key = None
+    self.skipped_frames = 0  # frames skipped as unchanged (diagnostics)
 
     self._create_mesh(radial_segments, height_segments)
     apply_material(stage, self.mesh_prim)
 
+    if NUMBA_AVAILABLE:
+      # Pay the JIT compile (or cache load) up front, not on first frame
+      _deform_kernel(
+        self._base_rings, self.unique_heights, self._out_rings,
+        0, 1, np.float32(0.0), np.float32(1.0), np.float32(0.0)
+      )
+
   def _create_mesh(self, radial_segments: int, height_segments: int):
     """Create cylinder mesh."""
     num_verts = (height_segments + 1) * radial_segments
 
-    points = np.zeros((num_verts, 3), dtype=np.float64)
-    normals = np.zeros((num_verts, 3), dtype=np.float64)
+    # Ring trig and row heights on a (H+1, R) grid, no per-vertex Python
+    cos_a, sin_a = CylinderGenerator.ring_table(radial_segments)
+    heights = np.arange(height_segments + 1) * (self.length / height_segments)
+    cos_grid, y_grid = np.meshgrid(cos_a, heights)
+    sin_grid = np.broadcast_to(sin_a, cos_grid.shape)
 
-    idx = 0
-    for h in range(height_segments + 1):
-      y = (h / height_segments) * self.length
-      for r in range(radial_segments):
-        angle = (r / radial_segments) * 2.0 * math.pi
-        cos_a, sin_a = math.cos(angle), math.sin(angle)
-        points[idx] = [self.radius * cos_a, y, self.radius * sin_a]
-        normals[idx] = [cos_a, 0.0, sin_a]
-        idx += 1
+    # float32 end to end: matches Vec3f, so USD never down-converts
+    points = np.stack(
+      [self.radius * cos_grid, y_grid, self.radius * sin_grid], axis=-1
+    ).reshape(num_verts, 3).astype(np.float32)
+    normals = np.stack(
+      [cos_grid, np.zeros_like(cos_grid), sin_grid], axis=-1
+    ).reshape(num_verts, 3).astype(np.float32)
 
     self.base_points_np = points.copy()
     self.vertex_heights = points[:, 1].copy()
-    self.out_points = points.copy()
+    self.out_points_f32 = points.copy()
+
+    # Every vertex in a ring shares its height, so work per ring:
+    # (H+1, R, 3) views over the flat buffers for row broadcasting
+    ring_shape = (height_segments + 1, radial_segments, 3)
+    self.unique_heights = points[::radial_segments, 1].copy()
+    self._base_rings = self.base_points_np.reshape(ring_shape)
+    self._out_rings = self.out_points_f32.reshape(ring_shape)
+    self._scratch = np.empty(height_segments + 1, dtype=np.float32)
 
-    points_list = [Gf.Vec3f(float(p[0]), float(p[1]), float(p[2])) for p in points]
-    normals_list = [Gf.Vec3f(float(n[0]), float(n[1]), float(n[2])) for n in normals]
+    points_vt = Vt.Vec3fArray.FromNumpy(self.out_points_f32)
+    normals_vt = Vt.Vec3fArray.FromNumpy(normals)
 
-    face_vertex_counts, face_vertex_indices = [], []
-    for h in range(height_segments):
-      for r in range(radial_segments):
-        v0 = h * radial_segments + r
-        v1 = h * radial_segments + ((r + 1) % radial_segments)
-        v2 = (h + 1) * radial_segments + ((r + 1) % radial_segments)
-        v3 = (h + 1) * radial_segments + r
-        face_vertex_counts.extend([3, 3])
-        face_vertex_indices.extend([v0, v2, v1, v0, v3, v2])
+    face_vertex_counts, face_vertex_indices = CylinderGenerator.create_face_indices(
+      radial_segments, height_segments
+    )
 
     self.mesh_prim = UsdGeom.Mesh.Define(self.stage, self.path)
-    self.mesh_prim.CreatePointsAttr(points_list)
-    self.mesh_prim.CreateNormalsAttr(normals_list)
+    self.mesh_prim.CreatePointsAttr(points_vt)
+    self.mesh_prim.CreateNormalsAttr(normals_vt)
     self.mesh_prim.SetNormalsInterpolation(UsdGeom.Tokens.vertex)
-    self.mesh_prim.CreateFaceVertexCountsAttr(face_vertex_counts)
-    self.mesh_prim.CreateFaceVertexIndicesAttr(face_vertex_indices)
+    self.mesh_prim.CreateFaceVertexCountsAttr(Vt.IntArray.FromNumpy(face_vertex_counts))
+    self.mesh_prim.CreateFaceVertexIndicesAttr(Vt.IntArray.FromNumpy(face_vertex_indices))
     self.mesh_prim.CreateSubdivisionSchemeAttr("none")
     self.mesh_prim.CreateDoubleSidedAttr(True)
 
-    extent = UsdGeom.PointBased(self.mesh_prim).ComputeExtent(points_list)
+    extent = UsdGeom.PointBased(self.mesh_prim).ComputeExtent(points_vt)
     self.mesh_prim.CreateExtentAttr(extent)
     self.points_attr = self.mesh_prim.GetPointsAttr()
 
@@ -90,29 +139,71 @@ class V2NumpyTendroid:
 
   def apply_deformation(self, bubble_y: float, bubble_radius: float):
     """Vectorized deformation."""
-    max_radius = self.radius * (1.0 + self.max_amplitude)
-    radius_range = max_radius - self.radius
+    key = (round(bubble_y / PARAM_QUANTUM), round(bubble_radius / PARAM_QUANTUM))
+    if key == self._last_key:
+      self.skipped_frames += 1
+      return
+    self._last_key = key
+
+    radius_range = self._radius_range
 
     growth = 0.0
     if radius_range > 0:
-      growth = np.clip((bubble_radius - self.radius) / radius_range, 0.0, 1.0)
-
-    current_amp = self.max_amplitude * growth
-
-    sigma = bubble_radius * self.bulge_width
-    dist = self.vertex_heights - bubble_y
-    gaussian = np.exp(-(dist * dist) / (2.0 * sigma * sigma))
-
-    scale = 1.0 + current_amp * gaussian
-
-    self.out_points[:, 0] = self.base_points_np[:, 0] * scale
-    self.out_points[:, 1] = self.base_points_np[:, 1]
-    self.out_points[:, 2] = self.base_points_np[:, 2] * scale
-
-    points_list = [Gf.Vec3f(*p) for p in self.out_points.tolist()]
-
+      growth = min(max((bubble_radius - self.radius) / radius_range, 0.0), 1.0)
+
+    # float32 scalars keep NumPy from upcasting the per-vertex arrays
+    current_amp = np.float32(self.max_amplitude * growth)
+
+    sigma = np.float32(bubble_radius * self.bulge_width)
+    bubble_y = np.float32(bubble_y)
+    base, out = self._base_rings, self._out_rings
+
+    # Only rings within BAND_SIGMAS of the bubble are deformed; heights are
+    # sorted, so the band is a contiguous row range
+    band = np.float32(BAND_SIGMAS) * sigma
+    heights = self.unique_heights
+    lo = int(np.searchsorted(heights, bubble_y - band, side="left"))
+    hi = int(np.searchsorted(heights, bubble_y + band, side="right"))
+
+    # Rings that left the band since last frame go back to base shape
+    prev_lo, prev_hi = self._prev_band
+    dirty = lo < hi
+    for a, b in ((prev_lo, min(prev_hi, lo)), (max(prev_lo, hi), prev_hi)):
+      if a < b:
+        out[a:b, :, 0] = base[a:b, :, 0]
+        out[a:b, :, 2] = base[a:b, :, 2]
+        dirty = True
+    self._prev_band = (lo, hi)
+
+    # No ring touched (bubble off the mesh, already restored): the points
+    # USD holds are current, so skip the Set and its Hydra invalidation
+    if not dirty:
+      return
+
+    if NUMBA_AVAILABLE:
+      _deform_kernel(base, heights, out, lo, hi, bubble_y, sigma, current_amp)
+    else:
+      # Per-ring scale computed in place: no temporaries per frame
+      neg_inv_two_sigma_sq = np.float32(-0.5) / (sigma * sigma)
+      scratch = self._scratch[lo:hi]
+      np.subtract(heights[lo:hi], bubble_y, out=scratch)
+      np.multiply(scratch, scratch, out=scratch)
+      np.multiply(scratch, neg_inv_two_sigma_sq, out=scratch)
+      np.exp(scratch, out=scratch)
+      np.multiply(scratch, current_amp, out=scratch)
+      np.add(scratch, np.float32(1.0), out=scratch)
+
+      # Scale broadcast across each ring, written straight into the buffer
+      # handed to USD. Y is never deformed, so out keeps its initial copy.
+      scale = scratch[:, None]
+      np.multiply(base[lo:hi, :, 0], scale, out=out[lo:hi, :, 0])
+      np.multiply(base[lo:hi, :, 2], scale, out=out[lo:hi, :, 2])
+
+    # The reusable buffer is the NumPy array, not a VtArray: writing into a
+    # VtArray that USD already holds would bypass its copy-on-write and
+    # the attribute would see an unchanged value. FromNumpy is one memcpy.
     if self.points_attr:
-      self.points_attr.Set(points_list)
+      self.points_attr.Set(Vt.Vec3fArray.FromNumpy(self.out_points_f32))
 
   def destroy(self):
     if self.stage and self.path:
@@ -2,11 +2,11 @@
 V2 Tendroid - Single cylinder mesh with bubble-guided deformation (CPU version)
 """
 
-import math
-
 import carb
-from pxr import Gf, Usd, UsdGeom
+import numpy as np
+from pxr import Usd, UsdGeom, Vt
 
+from ..builders.cylinder_generator import CylinderGenerator
 from ..utils import apply_material
 
 
@@ -31,6 +31,12 @@ class V2Tendroid:
     self.base_points = []
     self.base_normals = []
     self.vertex_heights = []
+    self._base_np = None
+    self._out_np = None
+    self._ring_heights = None
+    self._base_rings = None
+    self._out_rings = None
+    self._scale_np = None
     self.mesh_prim = None
     self.points_attr = None
 
@@ -39,38 +45,43 @@ class V2Tendroid:
 
   def _create_mesh(self):
     """Create the cylinder mesh geometry."""
-    points, normals, heights = [], [], []
-
-    for h in range(self.height_segments + 1):
-      y = (h / self.height_segments) * self.length
-      for r in range(self.radial_segments):
-        angle = (r / self.radial_segments) * 2.0 * math.pi
-        x = self.radius * math.cos(angle)
-        z = self.radius * math.sin(angle)
-        points.append(Gf.Vec3f(x, y, z))
-        normals.append(Gf.Vec3f(math.cos(angle), 0.0, math.sin(angle)))
-        heights.append(y)
+    # Plain cylinder: the shared vectorized generator with no flare
+    points_np, normals_np, heights_np, _ = CylinderGenerator.create_cylinder_points(
+      radius=self.radius,
+      length=self.length,
+      radial_segments=self.radial_segments,
+      height_segments=self.height_segments,
+      flare_height_percent=0.0
+    )
+    points = Vt.Vec3fArray.FromNumpy(points_np)
+    normals = Vt.Vec3fArray.FromNumpy(normals_np)
 
     self.base_points = points
     self.base_normals = normals
-    self.vertex_heights = heights
-
-    face_vertex_counts, face_vertex_indices = [], []
-    for h in range(self.height_segments):
-      for r in range(self.radial_segments):
-        v0 = h * self.radial_segments + r
-        v1 = h * self.radial_segments + ((r + 1) % self.radial_segments)
-        v2 = (h + 1) * self.radial_segments + ((r + 1) % self.radial_segments)
-        v3 = (h + 1) * self.radial_segments + r
-        face_vertex_counts.extend([3, 3])
-        face_vertex_indices.extend([v0, v2, v1, v0, v3, v2])
+    self.vertex_heights = heights_np
+
+    # float32 buffers for the vectorized deformation path
+    self._base_np = points_np
+    self._out_np = points_np.copy()
+
+    # Every vertex in a ring shares its height, so the Gaussian is
+    # evaluated once per ring and broadcast over (H+1, R, 3) views
+    ring_shape = (self.height_segments + 1, self.radial_segments, 3)
+    self._ring_heights = heights_np[::self.radial_segments].copy()
+    self._base_rings = self._base_np.reshape(ring_shape)
+    self._out_rings = self._out_np.reshape(ring_shape)
+    self._scale_np = np.empty_like(self._ring_heights)
+
+    face_vertex_counts, face_vertex_indices = CylinderGenerator.create_face_indices(
+      self.radial_segments, self.height_segments
+    )
 
     self.mesh_prim = UsdGeom.Mesh.Define(self.stage, self.path)
     self.mesh_prim.CreatePointsAttr(points)
     self.mesh_prim.CreateNormalsAttr(normals)
     self.mesh_prim.SetNormalsInterpolation(UsdGeom.Tokens.vertex)
-    self.mesh_prim.CreateFaceVertexCountsAttr(face_vertex_counts)
-    self.mesh_prim.CreateFaceVertexIndicesAttr(face_vertex_indices)
+    self.mesh_prim.CreateFaceVertexCountsAttr(Vt.IntArray.FromNumpy(face_vertex_counts))
+    self.mesh_prim.CreateFaceVertexIndicesAttr(Vt.IntArray.FromNumpy(face_vertex_indices))
     self.mesh_prim.CreateSubdivisionSchemeAttr("none")
     self.mesh_prim.CreateDoubleSidedAttr(True)
 
@@ -80,15 +91,19 @@ class V2Tendroid:
 
   def apply_deformation(self, deformer, bubble_y: float, bubble_radius: float):
     """Apply bubble-guided deformation to the mesh."""
-    new_points = []
+    # Per-ring displacement becomes the scale in place, in a reused buffer
+    scale = deformer.vectorized_displacement(
+      self._ring_heights, bubble_y, bubble_radius, out=self._scale_np
+    )
+    scale += np.float32(1.0)
 
-    for base_pt, y in zip(self.base_points, self.vertex_heights):
-      displacement = deformer.calculate_displacement(y, bubble_y, bubble_radius)
-      scale = 1.0 + displacement
-      new_points.append(Gf.Vec3f(base_pt[0] * scale, base_pt[1], base_pt[2] * scale))
+    base, out = self._base_rings, self._out_rings
+    ring_scale = scale[:, None]
+    np.multiply(base[:, :, 0], ring_scale, out=out[:, :, 0])
+    np.multiply(base[:, :, 2], ring_scale, out=out[:, :, 2])
 
     if self.points_attr:
-      self.points_attr.Set(new_points)
+      self.points_attr.Set(Vt.Vec3fArray.FromNumpy(self._out_np))
 
   def reset_to_base(self):
     """Reset mesh to undeformed base shape."""
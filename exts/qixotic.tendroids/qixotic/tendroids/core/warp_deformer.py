@@ -8,6 +8,7 @@ Now includes wave displacement composition - wave and deformation
 are applied together in a single GPU pass.
 """
 
+import numpy as np
 import warp as wp
 
 wp.init()
@@ -142,6 +143,56 @@ def deform_cylinder_kernel_with_wave_state(
     out_points[tid] = wp.vec3(final_x, vertex_y, final_z)
 
 
+@wp.kernel
+def deform_cylinder_kernel_params(
+    base_points: wp.array(dtype=wp.vec3),
+    out_points: wp.array(dtype=wp.vec3),
+    height_factors: wp.array(dtype=float),
+    params: wp.array(dtype=float),
+    cylinder_radius: float,
+    max_amplitude: float,
+    bulge_width: float,
+):
+    """
+    Same deformation as deform_cylinder_kernel, with the per-frame values
+    read from a device buffer so the launch can be captured in a CUDA graph.
+    
+    params = [bubble_y, bubble_radius, wave_dx, wave_dz]
+    """
+    tid = wp.tid()
+    
+    bubble_y = params[0]
+    bubble_radius = params[1]
+    wave_dx = params[2]
+    wave_dz = params[3]
+    
+    pos = base_points[tid]
+    vertex_y = pos[1]
+    h_factor = height_factors[tid]
+    
+    max_radius = cylinder_radius * (1.0 + max_amplitude)
+    radius_range = max_radius - cylinder_radius
+    
+    growth_factor = 0.0
+    if radius_range > 0.0:
+        growth_factor = (bubble_radius - cylinder_radius) / radius_range
+        growth_factor = wp.clamp(growth_factor, 0.0, 1.0)
+    
+    current_amplitude = max_amplitude * growth_factor
+    
+    sigma = bubble_radius * bulge_width
+    dist = vertex_y - bubble_y
+    gaussian = wp.exp(-(dist * dist) / (2.0 * sigma * sigma))
+    
+    scale = 1.0 + current_amplitude * gaussian
+    
+    # Wave displacement added AFTER scaling (see deform_cylinder_kernel)
+    final_x = pos[0] * scale + wave_dx * h_factor
+    final_z = pos[2] * scale + wave_dz * h_factor
+    
+    out_points[tid] = wp.vec3(final_x, vertex_y, final_z)
+
+
 class V2WarpDeformer:
     """
     Warp-accelerated cylinder deformer with wave composition.
@@ -161,7 +212,8 @@ class V2WarpDeformer:
     ):
         """
         Args:
-            base_points_list: List of Gf.Vec3f base vertex positions
+            base_points_list: (N, 3) base vertex positions (Vt.Vec3fArray,
+                NumPy array or sequence of Gf.Vec3f)
             cylinder_radius: Base cylinder radius
             cylinder_length: Cylinder height (for height factor calc)
             max_amplitude: Maximum radial expansion fraction
@@ -175,44 +227,105 @@ class V2WarpDeformer:
         self.device = device
         self.num_points = len(base_points_list)
         
-        # Convert points to tuples
-        points_data = [(p[0], p[1], p[2]) for p in base_points_list]
+        # Vt.Vec3fArray exposes the buffer protocol: one copy, no per-vertex indexing
+        points_data = np.asarray(base_points_list, dtype=np.float32).reshape(-1, 3)
         
         # Pre-compute height factors (cubic interpolation for smooth sway)
-        height_factors = []
-        for p in base_points_list:
-            if cylinder_length > 0:
-                ratio = max(0.0, min(1.0, p[1] / cylinder_length))
-                # Smooth cubic: t^2 * (3 - 2t)
-                factor = ratio * ratio * (3.0 - 2.0 * ratio)
-            else:
-                factor = 0.0
-            height_factors.append(factor)
+        if cylinder_length > 0:
+            ratio = np.clip(points_data[:, 1] / cylinder_length, 0.0, 1.0)
+            # Smooth cubic: t^2 * (3 - 2t)
+            height_factors = ratio * ratio * (3.0 - 2.0 * ratio)
+        else:
+            height_factors = np.zeros(self.num_points, dtype=np.float32)
         
         # Upload to GPU
         self.base_points_gpu = wp.array(points_data, dtype=wp.vec3, device=device)
         self.height_factors_gpu = wp.array(height_factors, dtype=float, device=device)
         self.out_points_gpu = wp.zeros(self.num_points, dtype=wp.vec3, device=device)
+        
+        # CUDA graph for deform(): captured on first use, replayed per frame
+        # with only the 4-float parameter buffer changing
+        self._params_gpu = wp.zeros(4, dtype=float, device=device)
+        self._use_graph = wp.get_device(device).is_cuda
+        self._graph = None
+        
+        # Pinned host staging, double-buffered. Each slot's async copy
+        # records an event; the slot is refilled only after that event
+        # completes, however many frames are in flight
+        self._params_host = [
+            wp.zeros(4, dtype=float, device="cpu", pinned=self._use_graph)
+            for _ in range(2)
+        ]
+        self._params_host_np = [h.numpy() for h in self._params_host]
+        self._params_events = [
+            wp.Event(device) for _ in range(2)
+        ] if self._use_graph else None
+        self._params_slot = 0
+        
+        # Reused host buffer for the per-frame result download
+        self._out_host = wp.zeros(
+            self.num_points, dtype=wp.vec3, device="cpu", pinned=self._use_graph
+        )
+        self._out_host_np = self._out_host.numpy()
     
-    def deform(
-        self, 
-        bubble_y: float, 
+    def _launch_params_kernel(self):
+        """Launch the buffer-parameter kernel (recorded into the graph)."""
+        wp.launch(
+            kernel=deform_cylinder_kernel_params,
+            dim=self.num_points,
+            inputs=[
+                self.base_points_gpu,
+                self.out_points_gpu,
+                self.height_factors_gpu,
+                self._params_gpu,
+                self.cylinder_radius,
+                self.max_amplitude,
+                self.bulge_width,
+            ],
+            device=self.device
+        )
+    
+    def _capture_graph(self):
+        """Record the deformation launch as a CUDA graph."""
+        wp.capture_begin(device=self.device)
+        try:
+            self._launch_params_kernel()
+        finally:
+            self._graph = wp.capture_end(device=self.device)
+    
+    def deform_gpu(
+        self,
+        bubble_y: float,
         bubble_radius: float,
         wave_dx: float = 0.0,
         wave_dz: float = 0.0
-    ) -> list:
+    ) -> wp.array:
         """
-        Run deformation kernel with wave composition.
+        Run deformation kernel and leave the result on the device.
+        
+        Callers that can consume a CUDA array (e.g. a Fabric points
+        attribute via usdrt) avoid the device-to-host copy of deform().
         
-        Args:
-            bubble_y: Bubble center Y position
-            bubble_radius: Current bubble radius
-            wave_dx: Wave displacement in X
-            wave_dz: Wave displacement in Z
-            
         Returns:
-            NumPy array of deformed points
+            Warp array of deformed points (owned by this deformer)
         """
+        if self._use_graph:
+            slot = self._params_slot
+            self._params_slot = 1 - slot
+            # Wait until the copy that last read this slot has finished
+            wp.synchronize_event(self._params_events[slot])
+            staged = self._params_host_np[slot]
+            staged[0] = bubble_y
+            staged[1] = bubble_radius
+            staged[2] = wave_dx
+            staged[3] = wave_dz
+            wp.copy(self._params_gpu, self._params_host[slot])
+            wp.get_stream(self.device).record_event(self._params_events[slot])
+            if self._graph is None:
+                self._capture_graph()
+            wp.capture_launch(self._graph)
+            return self.out_points_gpu
+        
         wp.launch(
             kernel=deform_cylinder_kernel,
             dim=self.num_points,
@@ -232,7 +345,29 @@ class V2WarpDeformer:
             device=self.device
         )
         
-        return self.out_points_gpu.numpy()
+        return self.out_points_gpu
+    
+    def deform(
+        self, 
+        bubble_y: float, 
+        bubble_radius: float,
+        wave_dx: float = 0.0,
+        wave_dz: float = 0.0
+    ) -> list:
+        """
+        Run deformation kernel with wave composition.
+        
+        Args:
+            bubble_y: Bubble center Y position
+            bubble_radius: Current bubble radius
+            wave_dx: Wave displacement in X
+            wave_dz: Wave displacement in Z
+            
+        Returns:
+            NumPy array of deformed points
+        """
+        self.deform_gpu(bubble_y, bubble_radius, wave_dx, wave_dz)
+        return self._download_points()
     
     def deform_wave_only(self, wave_dx: float, wave_dz: float) -> list:
         """
@@ -298,7 +433,18 @@ class V2WarpDeformer:
             device=self.device
         )
         
-        return self.out_points_gpu.numpy()
+        return self._download_points()
+    
+    def _download_points(self) -> np.ndarray:
+        """
+        Copy out_points_gpu into the reused host buffer and return its view.
+        
+        The returned array is overwritten by the next deform call; callers
+        hand it straight to USD, which copies it.
+        """
+        wp.copy(self._out_host, self.out_points_gpu)
+        wp.synchronize_device(self.device)
+        return self._out_host_np
     
     def deform_wave_only_with_state(
         self,
@@ -321,6 +467,10 @@ class V2WarpDeformer:
     
     def destroy(self):
         """Free GPU resources."""
+        self._graph = None
+        self._params_gpu = None
+        self._params_host = self._params_host_np = self._params_events = None
+        self._out_host = self._out_host_np = None
         self.base_points_gpu = None
         self.height_factors_gpu = None
         self.out_points_gpu = None
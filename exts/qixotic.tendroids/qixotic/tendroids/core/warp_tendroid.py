@@ -2,13 +2,18 @@
 V2 Warp Tendroid - GPU-powered cylinder deformation
 """
 
-import math
-
 import carb
-from pxr import Gf, Usd, UsdGeom, Vt
+import omni.usd
+import warp as wp
+from pxr import Sdf, Usd, UsdGeom, Vt
 
 from .warp_deformer import V2WarpDeformer
-from ..utils import apply_material
+from ..builders.cylinder_generator import CylinderGenerator
+from ..utils import FabricHelper, apply_material
+
+# Bubble inputs are quantized to this step; frames whose quantized
+# (bubble_y, bubble_radius) match the previous one skip deformation
+PARAM_QUANTUM = 0.1
 
 
 class V2WarpTendroid:
@@ -33,6 +38,10 @@ class V2WarpTendroid:
     self.mesh_prim = None
     self.points_attr = None
     self.warp_deformer = None
+    self._fabric_points_attr = None
+    self._fabric_resolved = False
+    self._last_key = None
+    self.skipped_frames = 0  # frames skipped as unchanged (diagnostics)
 
     self._create_mesh()
     apply_material(stage, self.mesh_prim)
@@ -48,36 +57,29 @@ class V2WarpTendroid:
 
   def _create_mesh(self):
     """Create the cylinder mesh geometry."""
-    points = []
-    normals = []
-
-    for h in range(self.height_segments + 1):
-      y = (h / self.height_segments) * self.length
-      for r in range(self.radial_segments):
-        angle = (r / self.radial_segments) * 2.0 * math.pi
-        x = self.radius * math.cos(angle)
-        z = self.radius * math.sin(angle)
-        points.append(Gf.Vec3f(x, y, z))
-        normals.append(Gf.Vec3f(math.cos(angle), 0.0, math.sin(angle)))
+    # Plain cylinder: the shared vectorized generator with no flare
+    points_np, normals_np, _, _ = CylinderGenerator.create_cylinder_points(
+      radius=self.radius,
+      length=self.length,
+      radial_segments=self.radial_segments,
+      height_segments=self.height_segments,
+      flare_height_percent=0.0
+    )
+    points = Vt.Vec3fArray.FromNumpy(points_np)
+    normals = Vt.Vec3fArray.FromNumpy(normals_np)
 
     self.base_points = points
 
-    face_vertex_counts, face_vertex_indices = [], []
-    for h in range(self.height_segments):
-      for r in range(self.radial_segments):
-        v0 = h * self.radial_segments + r
-        v1 = h * self.radial_segments + ((r + 1) % self.radial_segments)
-        v2 = (h + 1) * self.radial_segments + ((r + 1) % self.radial_segments)
-        v3 = (h + 1) * self.radial_segments + r
-        face_vertex_counts.extend([3, 3])
-        face_vertex_indices.extend([v0, v2, v1, v0, v3, v2])
+    face_vertex_counts, face_vertex_indices = CylinderGenerator.create_face_indices(
+      self.radial_segments, self.height_segments
+    )
 
     self.mesh_prim = UsdGeom.Mesh.Define(self.stage, self.path)
     self.mesh_prim.CreatePointsAttr(points)
     self.mesh_prim.CreateNormalsAttr(normals)
     self.mesh_prim.SetNormalsInterpolation(UsdGeom.Tokens.vertex)
-    self.mesh_prim.CreateFaceVertexCountsAttr(face_vertex_counts)
-    self.mesh_prim.CreateFaceVertexIndicesAttr(face_vertex_indices)
+    self.mesh_prim.CreateFaceVertexCountsAttr(Vt.IntArray.FromNumpy(face_vertex_counts))
+    self.mesh_prim.CreateFaceVertexIndicesAttr(Vt.IntArray.FromNumpy(face_vertex_indices))
     self.mesh_prim.CreateSubdivisionSchemeAttr("none")
     self.mesh_prim.CreateDoubleSidedAttr(True)
 
@@ -85,18 +87,64 @@ class V2WarpTendroid:
     self.mesh_prim.CreateExtentAttr(extent)
     self.points_attr = self.mesh_prim.GetPointsAttr()
 
+    # "Deformable" tag makes OmniHydra render points from Fabric; without
+    # it the Fabric-only writes in apply_deformation would never show
+    prim = self.mesh_prim.GetPrim()
+    if not prim.HasAttribute("Deformable"):
+      prim.CreateAttribute("Deformable", Sdf.ValueTypeNames.Token, True)
+
+  def _resolve_fabric_points(self):
+    """Look up the Fabric points attribute; retried until the prim is in Fabric."""
+    try:
+      stage_id = omni.usd.get_context().get_stage_id()
+      usdrt_stage = FabricHelper.get_usdrt_stage(stage_id)
+      self._fabric_points_attr = FabricHelper.get_fabric_points_attribute(
+        usdrt_stage, self.path
+      )
+    except Exception as e:
+      # Fabric itself is unavailable: stay on the CPU path for good
+      carb.log_warn(f"[V2WarpTendroid] Fabric unavailable, using CPU path: {e}")
+      self._fabric_points_attr = None
+      self._fabric_resolved = True
+      return
+    # Prim not in Fabric yet: look it up again on the next deformed frame
+    self._fabric_resolved = self._fabric_points_attr is not None
+
   def apply_deformation(self, bubble_y: float, bubble_radius: float):
     """Apply GPU-accelerated deformation."""
     if not self.warp_deformer:
       return
 
+    key = (round(bubble_y / PARAM_QUANTUM), round(bubble_radius / PARAM_QUANTUM))
+    if key == self._last_key:
+      self.skipped_frames += 1
+      return
+    self._last_key = key
+
+    if not self._fabric_resolved:
+      self._resolve_fabric_points()
+
+    if self._fabric_points_attr:
+      # Device-resident path: usdrt reads the Warp array through
+      # __cuda_array_interface__, so no per-frame GPU->CPU copy
+      RtVt = FabricHelper.get_usdrt_vt()
+      points_gpu = self.warp_deformer.deform_gpu(bubble_y, bubble_radius)
+      # The interface carries no stream, so usdrt cannot order its read
+      # after the kernel: finish Warp's stream first
+      device = wp.get_device(self.warp_deformer.device)
+      if device.is_cuda:
+        wp.synchronize_stream(wp.get_stream(device))
+      self._fabric_points_attr.Set(RtVt.Vec3fArray(points_gpu))
+      return
+
     new_points_np = self.warp_deformer.deform(bubble_y, bubble_radius)
 
     if self.points_attr:
-      self.points_attr.Set(new_points_np)
+      self.points_attr.Set(Vt.Vec3fArray.FromNumpy(new_points_np))
 
   def destroy(self):
     """Clean up GPU and USD resources."""
+    self._fabric_points_attr = None
     if self.warp_deformer:
       self.warp_deformer.destroy()
       self.warp_deformer = None
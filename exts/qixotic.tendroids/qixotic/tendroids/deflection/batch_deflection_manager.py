@@ -8,11 +8,16 @@ Provides batch processing of multiple tendroid deflections using Warp GPU.
 
 import math
 from dataclasses import dataclass
+from itertools import repeat
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 try:
   import warp as wp
 
+  from .warp_deflection_kernel import batch_deflection_step_kernel
+
   WARP_AVAILABLE = True
 except ImportError:
   wp = None
@@ -63,17 +68,29 @@ class BatchDeflectionManager:
     self._tendroid_count = 0
     self._built = False
 
-    # Tendroid geometry arrays (GPU)
+    # Tendroid geometry arrays (NumPy on CPU, Warp on GPU)
     self._center_x: Optional[object] = None
     self._center_z: Optional[object] = None
     self._base_y: Optional[object] = None
     self._height: Optional[object] = None
     self._radius: Optional[object] = None
 
-    # Deflection state arrays (GPU)
+    # Deflection state arrays
     self._current_angles: Optional[object] = None
     self._target_angles: Optional[object] = None
-    self._deflection_axes: Optional[object] = None
+    # Axes lie in the XZ plane, so only their x/z components are stored,
+    # each as its own contiguous array
+    self._axis_x: Optional[object] = None
+    self._axis_z: Optional[object] = None
+
+    # GPU only: per-frame (angle, axis_x, axis_z) packed for one download
+    self._frame_out: Optional[object] = None
+
+    # Per-tendroid invariants derived from geometry + config (CPU path)
+    self._top_y: Optional[np.ndarray] = None
+    self._inv_height: Optional[np.ndarray] = None
+    self._detect_dist: Optional[np.ndarray] = None
+    self._inv_detect_dist: Optional[np.ndarray] = None
 
     # Configuration
     self._detection_range = 0.5
@@ -120,6 +137,9 @@ class BatchDeflectionManager:
     self._deflection_rate = deflection_rate
     self._recovery_rate = recovery_rate
 
+    if self._top_y is not None:
+      self._update_invariants()
+
   def register_tendroids(self, tendroids: List) -> None:
     """
     Register tendroids for batch processing.
@@ -140,7 +160,8 @@ class BatchDeflectionManager:
     height = [t.length for t in tendroids]
     radius = [t.radius for t in tendroids]
 
-    if WARP_AVAILABLE:
+    # __init__ forces "cpu" when Warp is missing, so the device alone decides
+    if self.device != "cpu":
       self._build_gpu_arrays(center_x, center_z, base_y, height, radius)
     else:
       self._build_cpu_arrays(center_x, center_z, base_y, height, radius)
@@ -167,7 +188,9 @@ class BatchDeflectionManager:
     # State arrays (initialized to zero)
     self._current_angles = wp.zeros(n, dtype=float, device=self.device)
     self._target_angles = wp.zeros(n, dtype=float, device=self.device)
-    self._deflection_axes = wp.zeros(n, dtype=wp.vec3, device=self.device)
+    self._axis_x = wp.array(np.ones(n), dtype=float, device=self.device)
+    self._axis_z = wp.zeros(n, dtype=float, device=self.device)
+    self._frame_out = wp.zeros(n, dtype=wp.vec3, device=self.device)
 
   def _build_cpu_arrays(
     self,
@@ -177,17 +200,31 @@ class BatchDeflectionManager:
     height: List[float],
     radius: List[float]
   ) -> None:
-    """Build CPU arrays as fallback."""
-    self._center_x = center_x
-    self._center_z = center_z
-    self._base_y = base_y
-    self._height = height
-    self._radius = radius
+    """Build NumPy arrays for vectorized CPU processing."""
+    self._center_x = np.array(center_x, dtype=np.float64)
+    self._center_z = np.array(center_z, dtype=np.float64)
+    self._base_y = np.array(base_y, dtype=np.float64)
+    self._height = np.array(height, dtype=np.float64)
+    self._radius = np.array(radius, dtype=np.float64)
 
     n = self._tendroid_count
-    self._current_angles = [0.0] * n
-    self._target_angles = [0.0] * n
-    self._deflection_axes = [(1.0, 0.0, 0.0)] * n
+    self._current_angles = np.zeros(n, dtype=np.float64)
+    self._target_angles = np.zeros(n, dtype=np.float64)
+    self._axis_x = np.ones(n, dtype=np.float64)
+    self._axis_z = np.zeros(n, dtype=np.float64)
+
+    self._update_invariants()
+
+  def _update_invariants(self) -> None:
+    """Cache the per-tendroid terms that only change on register/configure."""
+    height = self._height
+    self._top_y = self._base_y + height
+    self._inv_height = np.zeros_like(height)
+    np.divide(1.0, height, out=self._inv_height, where=height > 0)
+    self._detect_dist = self._radius + (
+      self._approach_buffer + self._detection_range
+    )
+    self._inv_detect_dist = 1.0 / self._detect_dist
 
   def compute_deflections(
     self,
@@ -209,7 +246,8 @@ class BatchDeflectionManager:
     if not self._built:
       return [], []
 
-    if WARP_AVAILABLE and self.device != "cpu":
+    # __init__ forces "cpu" when Warp is missing, so the device alone decides
+    if self.device != "cpu":
       return self._compute_gpu(creature_pos, creature_vel, dt)
     else:
       return self._compute_cpu(creature_pos, creature_vel, dt)
@@ -220,72 +258,55 @@ class BatchDeflectionManager:
     creature_vel: Tuple[float, float, float],
     dt: float
   ) -> Tuple[List[float], List[Tuple[float, float, float]]]:
-    """CPU fallback computation."""
+    """CPU computation, vectorized over all tendroids."""
     cx, cy, cz = creature_pos
-
-    for i in range(self._tendroid_count):
-      # Get tendroid geometry
-      tx = self._center_x[i]
-      tz = self._center_z[i]
-      by = self._base_y[i]
-      h = self._height[i]
-      r = self._radius[i]
-
-      # Calculate horizontal distance
-      dx = cx - tx
-      dz = cz - tz
-      dist_xz = math.sqrt(dx * dx + dz * dz)
-
-      # Detection threshold
-      detect_dist = r + self._approach_buffer + self._detection_range
-
-      # Check if creature is in range
-      if dist_xz > detect_dist:
-        # Recover toward zero
-        self._target_angles[i] = 0.0
-      elif cy >= by and cy <= by + h:
-        # Within tendroid height range - calculate deflection
-        height_ratio = (cy - by) / h if h > 0 else 0.0
-
-        # Distance factor (closer = more deflection)
-        dist_ratio = 1.0 - (dist_xz / detect_dist)
-        dist_ratio = max(0.0, min(1.0, dist_ratio))
-
-        # Height-proportional deflection
-        target = self._min_deflection + (
-          self._max_deflection - self._min_deflection
-        ) * height_ratio * dist_ratio
-
-        self._target_angles[i] = target
-
-        # Calculate deflection axis (perpendicular to approach)
-        if dist_xz > 0.001:
-          nx = dx / dist_xz
-          nz = dz / dist_xz
-          # Axis is perpendicular to normal in XZ plane
-          self._deflection_axes[i] = (-nz, 0.0, nx)
-      else:
-        # Above or below - recover
-        self._target_angles[i] = 0.0
-
-      # Smooth transition
-      current = self._current_angles[i]
-      target = self._target_angles[i]
-
-      if current < target:
-        rate = self._deflection_rate
-      else:
-        rate = self._recovery_rate
-
-      diff = target - current
-      max_change = rate * dt
-
-      if abs(diff) <= max_change:
-        self._current_angles[i] = target
-      else:
-        self._current_angles[i] = current + math.copysign(max_change, diff)
-
-    return self._current_angles[:], self._deflection_axes[:]
+    n = self._tendroid_count
+    base_y = self._base_y
+
+    # Horizontal distance to every tendroid at once
+    dx = cx - self._center_x
+    dz = cz - self._center_z
+    dist_xz = np.hypot(dx, dz)
+
+    # In range horizontally and within the tendroid height span
+    active = (
+      (dist_xz <= self._detect_dist) & (cy >= base_y) & (cy <= self._top_y)
+    )
+
+    # Zero-height tendroids have inv_height 0, so their ratio is 0
+    height_ratio = (cy - base_y) * self._inv_height
+
+    # Distance factor (closer = more deflection)
+    dist_ratio = np.clip(1.0 - dist_xz * self._inv_detect_dist, 0.0, 1.0)
+
+    # Height-proportional deflection; everything else recovers toward zero
+    span = self._max_deflection - self._min_deflection
+    target = self._target_angles
+    target.fill(0.0)
+    target[active] = (
+      self._min_deflection + span * height_ratio * dist_ratio
+    )[active]
+
+    # Deflection axis (perpendicular to approach in XZ plane); tendroids
+    # not being approached keep their last axis
+    steer = active & (dist_xz > 0.001)
+    if steer.any():
+      inv_dist = 1.0 / dist_xz[steer]
+      self._axis_x[steer] = -dz[steer] * inv_dist
+      self._axis_z[steer] = dx[steer] * inv_dist
+
+    # Smooth transition, step clamped to rate * dt
+    current = self._current_angles
+    rate = np.where(
+      current < target, self._deflection_rate, self._recovery_rate
+    )
+    max_change = rate * dt
+    current += np.clip(target - current, -max_change, max_change)
+
+    axes = list(zip(
+      self._axis_x.tolist(), repeat(0.0, n), self._axis_z.tolist()
+    ))
+    return current.tolist(), axes
 
   def _compute_gpu(
     self,
@@ -293,21 +314,50 @@ class BatchDeflectionManager:
     creature_vel: Tuple[float, float, float],
     dt: float
   ) -> Tuple[List[float], List[Tuple[float, float, float]]]:
-    """GPU batch computation (uses CPU fallback for now)."""
-    # TODO: Implement actual GPU kernel when Warp kernel is ready
-    # For now, download arrays, compute on CPU, upload results
-    return self._compute_cpu(creature_pos, creature_vel, dt)
+    """GPU batch computation: one kernel launch, state stays on device."""
+    n = self._tendroid_count
+    cx, cy, cz = creature_pos
+
+    wp.launch(
+      batch_deflection_step_kernel,
+      dim=n,
+      inputs=[
+        self._center_x, self._center_z, self._base_y,
+        self._height, self._radius,
+        float(cx), float(cy), float(cz),
+        float(self._detection_range), float(self._approach_buffer),
+        float(self._min_deflection), float(self._max_deflection),
+        float(dt), float(self._deflection_rate), float(self._recovery_rate),
+        self._current_angles, self._target_angles,
+        self._axis_x, self._axis_z, self._frame_out,
+      ],
+      device=self.device
+    )
+
+    # One synchronizing copy of the packed results instead of one per array
+    frame = self._frame_out.numpy()
+    axes = list(zip(
+      frame[:, 1].tolist(), repeat(0.0, n), frame[:, 2].tolist()
+    ))
+    return frame[:, 0].tolist(), axes
+
+  def _host(self, arr):
+    """Host-side NumPy view of a state array."""
+    return arr if self.device == "cpu" else arr.numpy()
 
   def get_state(self, tendroid_id: int) -> Optional[Dict]:
     """Get deflection state for a specific tendroid."""
     if tendroid_id >= self._tendroid_count:
       return None
 
+    current = float(self._host(self._current_angles)[tendroid_id])
+    axis_x = float(self._host(self._axis_x)[tendroid_id])
+    axis_z = float(self._host(self._axis_z)[tendroid_id])
     return {
-      'current_angle': self._current_angles[tendroid_id],
-      'target_angle': self._target_angles[tendroid_id],
-      'deflection_axis': self._deflection_axes[tendroid_id],
-      'is_deflecting': abs(self._current_angles[tendroid_id]) > 0.001
+      'current_angle': current,
+      'target_angle': float(self._host(self._target_angles)[tendroid_id]),
+      'deflection_axis': (axis_x, 0.0, axis_z),
+      'is_deflecting': abs(current) > 0.001
     }
 
   def destroy(self) -> None:
@@ -319,5 +369,11 @@ class BatchDeflectionManager:
     self._radius = None
     self._current_angles = None
     self._target_angles = None
-    self._deflection_axes = None
+    self._axis_x = None
+    self._axis_z = None
+    self._frame_out = None
+    self._top_y = None
+    self._inv_height = None
+    self._detect_dist = None
+    self._inv_detect_dist = None
     self._built = False
@@ -47,6 +47,7 @@ class DeflectionIntegration:
         self.config = config or get_deflection_config()
         self._controller = DeflectionController(self.config)
         self._tendroid_map: Dict[str, int] = {}  # name -> id mapping
+        self._id_to_name: Dict[int, str] = {}  # inverse, kept in sync
         self._enabled = True
         
         carb.log_info("[DeflectionIntegration] Initialized")
@@ -90,7 +91,11 @@ class DeflectionIntegration:
         )
         
         self._controller.register_tendroid(tendroid_id, geometry)
+        previous_id = self._tendroid_map.get(name)
+        if previous_id is not None:
+            self._id_to_name.pop(previous_id, None)
         self._tendroid_map[name] = tendroid_id
+        self._id_to_name[tendroid_id] = name
     
     def register_tendroids(self, tendroid_wrappers: List) -> None:
         """
@@ -118,6 +123,7 @@ class DeflectionIntegration:
         """Remove a tendroid from tracking."""
         if name in self._tendroid_map:
             tendroid_id = self._tendroid_map.pop(name)
+            self._id_to_name.pop(tendroid_id, None)
             self._controller.unregister_tendroid(tendroid_id)
     
     def update(
@@ -177,7 +183,7 @@ class DeflectionIntegration:
     def get_deflecting_tendroids(self) -> List[str]:
         """Get names of tendroids currently deflecting."""
         deflecting_ids = self._controller.get_deflecting_tendroids()
-        id_to_name = {v: k for k, v in self._tendroid_map.items()}
+        id_to_name = self._id_to_name
         return [id_to_name[tid] for tid in deflecting_ids if tid in id_to_name]
     
     def get_state_by_name(self, name: str) -> Optional[TendroidDeflectionState]:
@@ -198,4 +204,5 @@ class DeflectionIntegration:
     def destroy(self) -> None:
         """Cleanup resources."""
         self._tendroid_map.clear()
+        self._id_to_name.clear()
         carb.log_info("[DeflectionIntegration] Destroyed")
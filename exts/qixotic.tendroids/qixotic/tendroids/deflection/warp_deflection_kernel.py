@@ -167,3 +167,82 @@ def smooth_deflection_kernel(
     out_angles[tid] = current + max_change
   else:
     out_angles[tid] = current - max_change
+
+
+@wp.kernel
+def batch_deflection_step_kernel(
+  # Tendroid geometry (per-tendroid)
+  tendroid_centers_x: wp.array(dtype=float),
+  tendroid_centers_z: wp.array(dtype=float),
+  tendroid_base_y: wp.array(dtype=float),
+  tendroid_heights: wp.array(dtype=float),
+  tendroid_radii: wp.array(dtype=float),
+  # Creature position (broadcast)
+  creature_x: float,
+  creature_y: float,
+  creature_z: float,
+  # Configuration
+  detection_range: float,
+  approach_buffer: float,
+  min_deflection: float,
+  max_deflection: float,
+  dt: float,
+  deflection_rate: float,
+  recovery_rate: float,
+  # State arrays (updated in place)
+  current_angles: wp.array(dtype=float),
+  target_angles: wp.array(dtype=float),
+  axis_x: wp.array(dtype=float),
+  axis_z: wp.array(dtype=float),
+  # Packed (angle, axis_x, axis_z) per tendroid for a single download
+  out_frame: wp.array(dtype=wp.vec3),
+):
+  """
+  GPU kernel for one BatchDeflectionManager frame.
+
+  Fuses target calculation and smoothing so state stays on the device;
+  mirrors BatchDeflectionManager._compute_cpu.
+  """
+  tid = wp.tid()
+
+  base_y = tendroid_base_y[tid]
+  height = tendroid_heights[tid]
+
+  # Calculate horizontal distance (XZ plane only)
+  dx = creature_x - tendroid_centers_x[tid]
+  dz = creature_z - tendroid_centers_z[tid]
+  horizontal_dist = wp.sqrt(dx * dx + dz * dz)
+
+  detect_dist = tendroid_radii[tid] + approach_buffer + detection_range
+
+  # Default: recover toward zero
+  target = 0.0
+
+  if horizontal_dist <= detect_dist and creature_y >= base_y and creature_y <= base_y + height:
+    height_ratio = 0.0
+    if height > 0.0:
+      height_ratio = (creature_y - base_y) / height
+
+    # Distance factor (closer = more deflection)
+    dist_ratio = wp.clamp(1.0 - horizontal_dist / detect_dist, 0.0, 1.0)
+
+    target = min_deflection + (max_deflection - min_deflection) * height_ratio * dist_ratio
+
+    # Axis perpendicular to approach; kept from last frame when too close
+    if horizontal_dist > 0.001:
+      axis_x[tid] = -dz / horizontal_dist
+      axis_z[tid] = dx / horizontal_dist
+
+  target_angles[tid] = target
+
+  # Smooth transition, step clamped to rate * dt
+  current = current_angles[tid]
+  rate = recovery_rate
+  if current < target:
+    rate = deflection_rate
+
+  max_change = rate * dt
+  current = current + wp.clamp(target - current, -max_change, max_change)
+  current_angles[tid] = current
+
+  out_frame[tid] = wp.vec3(current, axis_x[tid], axis_z[tid])
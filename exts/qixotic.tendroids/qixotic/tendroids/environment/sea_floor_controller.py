@@ -5,7 +5,8 @@ Handles USD mesh creation for contoured sea floor terrain.
 """
 
 import carb
-from pxr import Gf, Sdf, UsdGeom, UsdShade
+import numpy as np
+from pxr import Sdf, UsdGeom, UsdShade, Vt
 
 from .sea_floor_config import SeaFloorConfig
 from .sea_floor_helper import initialize_height_map
@@ -55,17 +56,19 @@ class SeaFloorController:
       mesh_prim = UsdGeom.Mesh.Define(stage, config.mesh_path)
       
       # Build vertices with height variation
-      vertices = SeaFloorController._build_vertices(config, _height_map)
+      vertices = Vt.Vec3fArray.FromNumpy(
+        SeaFloorController._build_vertices(config, _height_map)
+      )
       mesh_prim.CreatePointsAttr(vertices)
       
       # Build face topology (quads)
       face_counts, face_indices = SeaFloorController._build_faces(config)
-      mesh_prim.CreateFaceVertexCountsAttr(face_counts)
-      mesh_prim.CreateFaceVertexIndicesAttr(face_indices)
+      mesh_prim.CreateFaceVertexCountsAttr(Vt.IntArray.FromNumpy(face_counts))
+      mesh_prim.CreateFaceVertexIndicesAttr(Vt.IntArray.FromNumpy(face_indices))
       
       # Build normals
       normals = SeaFloorController._build_normals(config, vertices)
-      mesh_prim.CreateNormalsAttr(normals)
+      mesh_prim.CreateNormalsAttr(Vt.Vec3fArray.FromNumpy(normals))
       mesh_prim.SetNormalsInterpolation(UsdGeom.Tokens.vertex)
       
       # Build UVs
@@ -76,7 +79,7 @@ class SeaFloorController:
         Sdf.ValueTypeNames.TexCoord2fArray,
         UsdGeom.Tokens.vertex
       )
-      uv_primvar.Set(uvs)
+      uv_primvar.Set(Vt.Vec2fArray.FromNumpy(uvs))
       
       # Compute extent
       extent = UsdGeom.PointBased(mesh_prim).ComputeExtent(vertices)
@@ -101,64 +104,62 @@ class SeaFloorController:
       return False
   
   @staticmethod
-  def _build_vertices(config: SeaFloorConfig, height_map) -> list:
-    """Build vertex positions with height map."""
+  def _build_vertices(config: SeaFloorConfig, height_map) -> np.ndarray:
+    """Build (N, 3) float32 vertex positions with height map."""
     if height_map is None:
       raise ValueError("Height map cannot be None")
     
-    vertices = []
     half_width = config.width / 2.0
     half_depth = config.depth / 2.0
     
-    for y_idx in range(config.resolution_y + 1):
-      for x_idx in range(config.resolution_x + 1):
-        x = -half_width + (x_idx * config.grid_spacing_x)
-        z = -half_depth + (y_idx * config.grid_spacing_y)
-        y = height_map[y_idx, x_idx]
-        
-        vertices.append(Gf.Vec3f(x, y, z))
+    # Row-major grid (z rows, x columns), matching the face indices
+    xs = -half_width + np.arange(config.resolution_x + 1) * config.grid_spacing_x
+    zs = -half_depth + np.arange(config.resolution_y + 1) * config.grid_spacing_y
+    
+    shape = (config.resolution_y + 1, config.resolution_x + 1)
+    vertices = np.empty(shape + (3,), dtype=np.float32)
+    vertices[..., 0] = xs[None, :]
+    vertices[..., 1] = height_map
+    vertices[..., 2] = zs[:, None]
     
-    return vertices
+    return vertices.reshape(-1, 3)
   
   @staticmethod
   def _build_faces(config: SeaFloorConfig) -> tuple:
-    """Build face topology (quads)."""
-    face_counts = []
-    face_indices = []
-    
+    """Build face topology (quads) as int32 arrays."""
     cols = config.resolution_x + 1
     
-    for y_idx in range(config.resolution_y):
-      for x_idx in range(config.resolution_x):
-        # Quad corners (counter-clockwise)
-        i0 = y_idx * cols + x_idx
-        i1 = i0 + 1
-        i2 = i0 + cols + 1
-        i3 = i0 + cols
-        
-        face_counts.append(4)
-        face_indices.extend([i0, i1, i2, i3])
+    # Quad corners (counter-clockwise)
+    y_idx = np.arange(config.resolution_y, dtype=np.int32)[:, None]
+    x_idx = np.arange(config.resolution_x, dtype=np.int32)[None, :]
+    i0 = y_idx * cols + x_idx
+    face_indices = np.stack(
+      [i0, i0 + 1, i0 + cols + 1, i0 + cols], axis=-1
+    ).ravel()
+    face_counts = np.full(config.resolution_x * config.resolution_y, 4, dtype=np.int32)
     
     return face_counts, face_indices
   
   @staticmethod
-  def _build_normals(config: SeaFloorConfig, vertices: list) -> list:
+  def _build_normals(config: SeaFloorConfig, vertices) -> np.ndarray:
     """Build vertex normals (simple upward for now)."""
     # For simplicity, use upward normals
     # Could be enhanced to compute actual surface normals
-    return [Gf.Vec3f(0, 1, 0) for _ in vertices]
+    normals = np.zeros((len(vertices), 3), dtype=np.float32)
+    normals[:, 1] = 1.0
+    return normals
   
   @staticmethod
-  def _build_uvs(config: SeaFloorConfig) -> list:
-    """Build UV coordinates."""
-    uvs = []
+  def _build_uvs(config: SeaFloorConfig) -> np.ndarray:
+    """Build (N, 2) float32 UV coordinates."""
     scale_x = 8.0
     scale_y = 8.0
     
-    for y_idx in range(config.resolution_y + 1):
-      v = (y_idx / config.resolution_y) * scale_y
-      for x_idx in range(config.resolution_x + 1):
-        u = (x_idx / config.resolution_x) * scale_x
-        uvs.append(Gf.Vec2f(u, v))
+    u = np.arange(config.resolution_x + 1) / config.resolution_x * scale_x
+    v = np.arange(config.resolution_y + 1) / config.resolution_y * scale_y
+    
+    uvs = np.empty((config.resolution_y + 1, config.resolution_x + 1, 2), dtype=np.float32)
+    uvs[..., 0] = u[None, :]
+    uvs[..., 1] = v[:, None]
     
-    return uvs
+    return uvs.reshape(-1, 2)
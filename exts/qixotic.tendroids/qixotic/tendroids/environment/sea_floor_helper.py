@@ -4,6 +4,8 @@ Sea floor helper functions for height calculations
 Handles Perlin noise generation and height queries with bilinear interpolation.
 """
 
+import dataclasses
+
 import carb
 import numpy as np
 from .sea_floor_config import SeaFloorConfig
@@ -39,6 +41,9 @@ def initialize_height_map(config: SeaFloorConfig = None):
   """
   Generate and cache the height map.
   
+  The map is only regenerated when the config differs from the one it
+  was built with, so repeated demo starts reuse it.
+  
   Args:
       config: Configuration for terrain generation
   """
@@ -47,7 +52,11 @@ def initialize_height_map(config: SeaFloorConfig = None):
   if config is None:
     config = SeaFloorConfig()
   
-  _config = config
+  if _height_map is not None and _config == config:
+    return
+  
+  # Snapshot, so later edits to the caller's instance are seen as changes
+  _config = dataclasses.replace(config)
   
   # Get noise module
   noise = _get_noise_module()
@@ -106,40 +115,51 @@ def initialize_height_map(config: SeaFloorConfig = None):
   )
 
 
-def get_height_at(x: float, y: float) -> float:
+def get_height_at(x, y):
   """
   Get floor height at world position using bilinear interpolation.
   
+  Accepts scalars or NumPy arrays, so a whole batch of positions can be
+  sampled in one call.
+  
   Args:
-      x: World X coordinate
-      y: World Y coordinate (depth)
+      x: World X coordinate(s)
+      y: World Y coordinate(s) (depth)
   
   Returns:
-      Z height at position (0.0 if outside bounds or not initialized)
+      Z height at position (0.0 if outside bounds or not initialized);
+      a float for scalar input, a float64 array for array input
   """
   global _height_map, _config
   
+  scalar = np.ndim(x) == 0 and np.ndim(y) == 0
+  x = np.asarray(x, dtype=np.float64)
+  y = np.asarray(y, dtype=np.float64)
+  
   if _height_map is None or _config is None:
-    return 0.0
+    heights = np.zeros(np.broadcast(x, y).shape)
+    return float(heights) if scalar else heights
   
   # Convert world coords to grid space
   half_width = _config.width / 2.0
   half_depth = _config.depth / 2.0
   
   # Check bounds
-  if (x < -half_width or x > half_width or 
-      y < -half_depth or y > half_depth):
-    return 0.0
+  inside = (
+    (x >= -half_width) & (x <= half_width) &
+    (y >= -half_depth) & (y <= half_depth)
+  )
   
-  # Map to grid indices (fractional)
-  grid_x = (x + half_width) / _config.grid_spacing_x
-  grid_y = (y + half_depth) / _config.grid_spacing_y
+  # Map to grid indices (fractional); outside points are clamped so the
+  # lookups stay valid and are zeroed below
+  grid_x = np.clip((x + half_width) / _config.grid_spacing_x, 0, _config.resolution_x)
+  grid_y = np.clip((y + half_depth) / _config.grid_spacing_y, 0, _config.resolution_y)
   
   # Get integer indices for corners
-  x0 = int(np.floor(grid_x))
-  y0 = int(np.floor(grid_y))
-  x1 = min(x0 + 1, _config.resolution_x)
-  y1 = min(y0 + 1, _config.resolution_y)
+  x0 = np.floor(grid_x).astype(np.intp)
+  y0 = np.floor(grid_y).astype(np.intp)
+  x1 = np.minimum(x0 + 1, _config.resolution_x)
+  y1 = np.minimum(y0 + 1, _config.resolution_y)
   
   # Get fractional parts
   fx = grid_x - x0
@@ -154,4 +174,5 @@ def get_height_at(x: float, y: float) -> float:
   h0 = h00 * (1 - fx) + h10 * fx
   h1 = h01 * (1 - fx) + h11 * fx
   
-  return h0 * (1 - fy) + h1 * fy
+  heights = np.where(inside, h0 * (1 - fy) + h1 * fy, 0.0)
+  return float(heights) if scalar else heights
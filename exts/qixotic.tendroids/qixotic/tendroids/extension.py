@@ -5,6 +5,8 @@ Omniverse extension for creating and animating Tendroid creatures.
 Uses GPU-accelerated system with wave animation.
 """
 
+import time
+
 import carb
 import omni.ext
 import omni.usd
@@ -14,6 +16,9 @@ import omni.kit.window.extensions
 from .scene.manager import V2SceneManager
 from .ui.control_panel import V2ControlPanel
 
+# UI bookkeeping runs at ~10 Hz; nobody needs it every Kit frame
+_UI_UPDATE_INTERVAL = 0.1
+
 
 class TendroidsExtension(omni.ext.IExt):
     """
@@ -39,6 +44,7 @@ class TendroidsExtension(omni.ext.IExt):
             self._control_panel.create_ui()
             
             # Subscribe to update events for UI (stress test controller)
+            self._last_ui_update = 0.0
             update_stream = omni.kit.app.get_app().get_update_event_stream()
             self._ui_update_subscription = update_stream.create_subscription_to_pop(
                 self._on_ui_update,
@@ -61,11 +67,24 @@ class TendroidsExtension(omni.ext.IExt):
             event: Update event
         """
         try:
+            now = time.monotonic()
+            if now - self._last_ui_update < _UI_UPDATE_INTERVAL:
+                return
+            self._last_ui_update = now
+            
             dt = event.payload.get("dt", 0.0)
-            self._control_panel.update(dt)
+            if not self._control_panel.update(dt):
+                # Panel fully bound: nothing left to poll, stop the callback
+                self._unsubscribe_ui_update()
         except Exception as e:
             carb.log_error(f"[TendroidsExtension] UI update error: {e}")
 
+    def _unsubscribe_ui_update(self):
+        """Drop the UI update subscription if it is still active."""
+        if getattr(self, '_ui_update_subscription', None):
+            self._ui_update_subscription.unsubscribe()
+            self._ui_update_subscription = None
+
     def _set_extensions_filter(self, filter_text: str):
         """
         Set the Extensions panel search filter.
@@ -86,9 +105,7 @@ class TendroidsExtension(omni.ext.IExt):
         """Called when extension is unloaded."""
         try:
             # Unsubscribe from updates
-            if hasattr(self, '_ui_update_subscription') and self._ui_update_subscription:
-                self._ui_update_subscription.unsubscribe()
-                self._ui_update_subscription = None
+            self._unsubscribe_ui_update()
             
             # Clear Extensions panel filter
             self._set_extensions_filter("")
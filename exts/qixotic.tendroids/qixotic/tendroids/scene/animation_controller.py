@@ -8,10 +8,16 @@ GPU bubble physics fully supported with proper state synchronization.
 import time
 
 import carb
+from pxr import Gf, UsdGeom
 
-from ..animation import WaveConfig, WaveController
+from ..animation import DEFAULT_DT, WaveConfig, WaveController
 from ..bubbles import DEFAULT_V2_BUBBLE_CONFIG
 
+# Profiling reads the clock only every this many frames; at 60 fps that
+# is four polls per 1 s interval, and FPS is still measured over the
+# true elapsed time
+_PROFILE_POLL_FRAMES = 15
+
 
 class V2AnimationController:
   """
@@ -33,25 +39,27 @@ class V2AnimationController:
     self.is_running = False
 
     self._frame_count = 0
-    self._absolute_time = 0.0
 
     self.wave_controller = WaveController(WaveConfig())
 
+    # Wave-only mode: True once tendroids have been written at rest with
+    # waves disabled, so further frames have nothing new to write
+    self._wave_only_at_rest = False
+
     # Fabric GPU path (zero-copy mesh updates)
     self._use_fabric_write = True  # Enable Fabric by default
     self._stage_id = None
 
     # Profiling
     self._profiling_enabled = False
-    self._profile_samples = []
-    self._last_profile_time = 0
     self._profile_interval = 1.0
-    self._profile_frame_start = 0
+    self._reset_profile(0)
 
   def set_tendroids(self, tendroids: list, tendroid_data: list = None):
     """Set tendroids to animate."""
     self.tendroids = tendroids
     self.tendroid_data = tendroid_data or []
+    self._wave_only_at_rest = False
 
   def set_bubble_manager(self, bubble_manager):
     """Set bubble manager for animation updates."""
@@ -101,13 +109,11 @@ class V2AnimationController:
 
     self.is_running = True
     self._frame_count = 0
-    self._absolute_time = 0.0
+    self._wave_only_at_rest = False
 
     self._profiling_enabled = enable_profiling
     if enable_profiling:
-      self._profile_samples = []
-      self._last_profile_time = time.perf_counter()
-      self._profile_frame_start = 0
+      self._reset_profile(time.perf_counter())
 
     carb.log_info("[V2AnimationController] Started")
 
@@ -122,7 +128,7 @@ class V2AnimationController:
 
     if self._profile_samples:
       self._log_profile_summary()
-      self._profile_samples = []
+      self._reset_profile(0)
 
     carb.log_info("[V2AnimationController] Stopped")
 
@@ -131,17 +137,15 @@ class V2AnimationController:
     try:
       self._frame_count += 1
 
-      if self._profiling_enabled:
+      if self._profiling_enabled and self._frame_count % _PROFILE_POLL_FRAMES == 0:
         self._sample_performance()
 
-      dt = 1.0 / 60.0
+      dt = DEFAULT_DT
       if event and hasattr(event, 'payload'):
         payload = event.payload
         if isinstance(payload, dict):
           dt = payload.get('dt', dt)
 
-      self._absolute_time += dt
-
       # Update wave motion
       self.wave_controller.update(dt)
       wave_state = self.wave_controller.get_wave_state()
@@ -162,8 +166,16 @@ class V2AnimationController:
             self.bubble_manager.pop_bubble(tendroid_name)
       # No bubbles - wave only
       else:
-        for tendroid in self.tendroids:
-          tendroid.apply_wave_only_with_state(wave_state)
+        wave_enabled = wave_state['enabled']
+        if wave_enabled or not self._wave_only_at_rest:
+          if self.batch_deformer and self.batch_deformer.is_built:
+            # No bubbles: every tendroid takes the idle defaults, so all
+            # of them deform in one launch instead of one per tendroid
+            self._apply_batch_deformation({}, wave_state)
+          else:
+            for tendroid in self.tendroids:
+              tendroid.apply_wave_only_with_state(wave_state)
+        self._wave_only_at_rest = not wave_enabled
         # Update interactive creature (Phase 1) - no bubbles
         if self.creature_controller:
           self.creature_controller.update(dt, wave_state=wave_state)
@@ -260,11 +272,13 @@ class V2AnimationController:
       default_config=DEFAULT_V2_BUBBLE_CONFIG
     )
 
-    # Single kernel launch for ALL vertices
-    all_points = self.batch_deformer.deform_all()
+    use_fabric = self._use_fabric_write and self._stage_id is not None
+
+    # Single kernel launch for ALL vertices (host copy only for CPU path)
+    all_points = self.batch_deformer.deform_all(download=not use_fabric)
 
     # Apply to meshes - choose write path
-    if self._use_fabric_write and self._stage_id is not None:
+    if use_fabric:
       # Fabric GPU path (zero-copy)
       self.batch_deformer.apply_to_meshes_fabric(self._stage_id)
     else:
@@ -328,8 +342,6 @@ class V2AnimationController:
     if not self.bubble_manager:
       return
 
-    from pxr import Gf, UsdGeom
-
     for name in self.bubble_manager._bubbles:
       state = self.bubble_manager._bubbles[name]
 
@@ -396,6 +408,16 @@ class V2AnimationController:
         else:
           UsdGeom.Imageable(state.sphere_prim).MakeVisible()
 
+  def _reset_profile(self, start_time: float):
+    """Clear profiling samples and running FPS accumulators."""
+    self._profile_samples = []
+    self._last_profile_time = start_time
+    self._profile_frame_start = 0
+    # Running stats so summaries never re-scan the sample list
+    self._profile_fps_sum = 0.0
+    self._profile_fps_min = float('inf')
+    self._profile_fps_max = 0.0
+
   def _sample_performance(self):
     """Sample FPS for profiling."""
     current_time = time.perf_counter()
@@ -411,6 +433,11 @@ class V2AnimationController:
         'frame_time_ms': (elapsed / frames * 1000) if frames > 0 else 0
       }
       self._profile_samples.append(sample)
+      self._profile_fps_sum += fps
+      if fps < self._profile_fps_min:
+        self._profile_fps_min = fps
+      if fps > self._profile_fps_max:
+        self._profile_fps_max = fps
 
       bubble_info = ""
       if self.bubble_manager:
@@ -429,10 +456,9 @@ class V2AnimationController:
     if not self._profile_samples:
       return
 
-    fps_values = [s['fps'] for s in self._profile_samples]
-    avg_fps = sum(fps_values) / len(fps_values)
-    min_fps = min(fps_values)
-    max_fps = max(fps_values)
+    avg_fps = self._profile_fps_sum / len(self._profile_samples)
+    min_fps = self._profile_fps_min
+    max_fps = self._profile_fps_max
 
     carb.log_info("=" * 50)
     carb.log_info(f"[PROFILE] Avg: {avg_fps:.1f}, Min: {min_fps:.1f}, Max: {max_fps:.1f}")
@@ -443,12 +469,11 @@ class V2AnimationController:
     if not self._profile_samples:
       return None
 
-    fps_values = [s['fps'] for s in self._profile_samples]
     return {
       'samples': self._profile_samples,
-      'avg_fps': sum(fps_values) / len(fps_values),
-      'min_fps': min(fps_values),
-      'max_fps': max(fps_values)
+      'avg_fps': self._profile_fps_sum / len(self._profile_samples),
+      'min_fps': self._profile_fps_min,
+      'max_fps': self._profile_fps_max
     }
 
   def shutdown(self):
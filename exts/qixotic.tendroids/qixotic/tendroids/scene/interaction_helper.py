@@ -14,6 +14,9 @@ from pxr import Gf
 import carb
 import math
 
+# Log avoidance every N frames per tendroid (roughly 0.5 seconds at 60fps)
+AVOIDANCE_LOG_INTERVAL = 30
+
 
 class TendroidCreatureInteraction:
     """
@@ -36,6 +39,9 @@ class TendroidCreatureInteraction:
         self.repulsion_range = 2.0  # Start repulsion this many units before contact
         self.velocity_damping = 0.5  # Reduce velocity on contact (0.5 = half speed)
         
+        # Frames left until the next avoidance log, per tendroid name
+        self._log_countdowns = {}
+        
     def update_interaction(
         self,
         tendroid,
@@ -248,17 +254,11 @@ class TendroidCreatureInteraction:
     
     def _should_log_avoidance(self, tendroid) -> bool:
         """Throttle avoidance logging to avoid spam."""
-        if not hasattr(self, '_log_counters'):
-            self._log_counters = {}
-        
-        if tendroid.name not in self._log_counters:
-            self._log_counters[tendroid.name] = 0
-        
-        self._log_counters[tendroid.name] += 1
-        
-        # Log every 30 frames (roughly 0.5 seconds at 60fps)
-        if self._log_counters[tendroid.name] >= 30:
-            self._log_counters[tendroid.name] = 0
-            return True
-        
-        return False
+        countdowns = self._log_countdowns
+        remaining = countdowns.get(tendroid.name, AVOIDANCE_LOG_INTERVAL) - 1
+        if remaining:
+            countdowns[tendroid.name] = remaining
+            return False
+        
+        countdowns[tendroid.name] = AVOIDANCE_LOG_INTERVAL
+        return True
@@ -5,7 +5,6 @@ Creates batches of V2 tendroids with randomized positions and proper spacing.
 """
 
 import carb
-import math
 import random
 
 from ..builders import V2TendroidBuilder
@@ -186,13 +185,13 @@ class V2TendroidFactory:
         Returns:
             True if position is valid (no interference)
         """
+        # Compare squared distances; both sides are non-negative, so no sqrt
         for ex, ez, existing_radius in existing_positions:
             dx = x - ex
             dz = z - ez
-            distance = math.sqrt(dx * dx + dz * dz)
             min_separation = spacing_multiplier * (base_radius + existing_radius)
             
-            if distance < min_separation:
+            if dx * dx + dz * dz < min_separation * min_separation:
                 return False
         
         return True
@@ -4,6 +4,10 @@ V2 Tendroid Wrapper - Lightweight wrapper for tendroid mesh with Warp deformer
 Provides unified interface for wave displacement and bubble deformation.
 """
 
+import math
+
+from pxr import Vt
+
 
 class V2TendroidWrapper:
     """
@@ -41,6 +45,11 @@ class V2TendroidWrapper:
         self._last_wave_dx = 0.0
         self._last_wave_dz = 0.0
 
+    def _set_points(self, new_points):
+        """Write deformer output (N, 3) float32 to USD without per-vertex Gf.Vec3f."""
+        if new_points is not None:
+            self.points_attr.Set(Vt.Vec3fArray.FromNumpy(new_points))
+
     def apply_deformation(
         self, 
         bubble_y: float, 
@@ -72,8 +81,7 @@ class V2TendroidWrapper:
             wave_dx,
             wave_dz
         )
-        if new_points is not None:
-            self.points_attr.Set(new_points)
+        self._set_points(new_points)
 
     def apply_wave_only(self, wave_dx: float, wave_dz: float):
         """
@@ -89,8 +97,7 @@ class V2TendroidWrapper:
         self._last_wave_dz = wave_dz
 
         new_points = self.deformer.deform_wave_only(wave_dx, wave_dz)
-        if new_points is not None:
-            self.points_attr.Set(new_points)
+        self._set_points(new_points)
     
     def apply_deformation_with_wave_state(
         self,
@@ -116,7 +123,6 @@ class V2TendroidWrapper:
         
         # Cache wave values for bubble position calculation
         if wave_state.get('enabled', False):
-            import math
             spatial_phase = self.position[0] * 0.003 + self.position[2] * 0.002
             spatial_factor = 1.0 + math.sin(spatial_phase) * 0.15
             displacement_value = wave_state['displacement'] * spatial_factor
@@ -133,8 +139,7 @@ class V2TendroidWrapper:
             self.position[0],
             self.position[2]
         )
-        if new_points is not None:
-            self.points_attr.Set(new_points)
+        self._set_points(new_points)
     
     def apply_wave_only_with_state(self, wave_state: dict):
         """
@@ -152,7 +157,6 @@ class V2TendroidWrapper:
         
         # Cache wave values for consistency
         if wave_state.get('enabled', False):
-            import math
             spatial_phase = self.position[0] * 0.003 + self.position[2] * 0.002
             spatial_factor = 1.0 + math.sin(spatial_phase) * 0.15
             displacement_value = wave_state['displacement'] * spatial_factor
@@ -167,8 +171,7 @@ class V2TendroidWrapper:
             self.position[0],
             self.position[2]
         )
-        if new_points is not None:
-            self.points_attr.Set(new_points)
+        self._set_points(new_points)
 
     def reset_deformation(self, wave_dx: float = 0.0, wave_dz: float = 0.0):
         """
@@ -188,8 +191,7 @@ class V2TendroidWrapper:
             wave_dx=wave_dx,
             wave_dz=wave_dz
         )
-        if new_points is not None:
-            self.points_attr.Set(new_points)
+        self._set_points(new_points)
 
     def get_spawn_height(self, spawn_pct: float = 0.10) -> float:
         """
@@ -4,10 +4,27 @@ Action buttons section for V2 control panel
 Handles spawn, clear, start/stop animation operations.
 """
 
+from functools import wraps
+
 import carb
 import omni.ui as ui
 
 
+def _handle(fn):
+    """Wrap a button handler so errors are reported to status and console."""
+    @wraps(fn)
+    def wrapper(self):
+        try:
+            fn(self)
+        except Exception as e:
+            self._update_status(f"Error: {e}")
+            carb.log_error(f"[V2ActionButtons] {fn.__name__} error: {e}")
+        finally:
+            # One status write per click, with the final message
+            self._flush_status()
+    return wrapper
+
+
 class ActionButtons:
     """Action buttons with scene manager integration."""
     
@@ -24,16 +41,26 @@ class ActionButtons:
         self.spawn_controls = spawn_controls
         self.creature_controls = creature_controls
         self.status_callback = None  # Callback(str) for status updates
+        self._pending_status = None
+        self._last_status = None
         
     def set_status_callback(self, callback):
         """Set callback for status updates."""
         self.status_callback = callback
     
     def _update_status(self, msg: str):
-        """Update status display."""
+        """Queue a status message; the display is updated by _flush_status()."""
+        self._pending_status = msg
+        carb.log_info(f"[V2ActionButtons] {msg}")
+    
+    def _flush_status(self):
+        """Send the latest queued status to the callback if it changed."""
+        msg, self._pending_status = self._pending_status, None
+        if msg is None or msg == self._last_status:
+            return
+        self._last_status = msg
         if self.status_callback:
             self.status_callback(msg)
-        carb.log_info(f"[V2ActionButtons] {msg}")
     
     def build(self, parent: ui.VStack = None):
         """Build action buttons UI."""
@@ -69,61 +96,51 @@ class ActionButtons:
                 
                 ui.Spacer(height=4)
     
+    @_handle
     def _on_spawn_clicked(self):
         """Handle spawn button click."""
-        try:
-            sp = self.spawn_controls
-            
-            # Use default geometry settings
-            radial_segs = 24
-            height_segs = 48
-            
-            # Check if creature should be spawned
-            spawn_creature = self.creature_controls.enabled if self.creature_controls else True
-            
-            self._update_status(f"Spawning {sp.count} tendroids...")
-            
-            success = self.scene_manager.create_tendroids(
-                count=sp.count,
-                spawn_area=(400, 400),  # Default area
-                radius_range=(8.0, 12.0),  # Default radius range
-                radial_segments=radial_segs,
-                height_segments=height_segs,
-                spawn_creature=spawn_creature
-            )
-            
-            if success:
-                actual = self.scene_manager.get_tendroid_count()
-                creature_msg = " + creature" if spawn_creature else ""
-                self._update_status(f"Spawned {actual} tendroids{creature_msg}")
-            else:
-                self._update_status("Spawn failed - check console")
-                
-        except Exception as e:
-            self._update_status(f"Error: {e}")
-            carb.log_error(f"[V2ActionButtons] Spawn error: {e}")
+        sp = self.spawn_controls
+        
+        # Use default geometry settings
+        radial_segs = 24
+        height_segs = 48
+        
+        # Check if creature should be spawned
+        spawn_creature = self.creature_controls.enabled if self.creature_controls else True
+        
+        self._update_status(f"Spawning {sp.count} tendroids...")
+        
+        success = self.scene_manager.create_tendroids(
+            count=sp.count,
+            spawn_area=(400, 400),  # Default area
+            radius_range=(8.0, 12.0),  # Default radius range
+            radial_segments=radial_segs,
+            height_segments=height_segs,
+            spawn_creature=spawn_creature
+        )
+        
+        if success:
+            actual = self.scene_manager.get_tendroid_count()
+            creature_msg = " + creature" if spawn_creature else ""
+            self._update_status(f"Spawned {actual} tendroids{creature_msg}")
+        else:
+            self._update_status("Spawn failed - check console")
     
+    @_handle
     def _on_clear_clicked(self):
         """Handle clear button click."""
-        try:
-            self.scene_manager.stop_animation()
-            self.scene_manager.clear_tendroids()
-            self._update_status("Cleared all tendroids")
-        except Exception as e:
-            self._update_status(f"Error: {e}")
+        self.scene_manager.stop_animation()
+        self.scene_manager.clear_tendroids()
+        self._update_status("Cleared all tendroids")
     
+    @_handle
     def _on_start_clicked(self):
         """Handle start animation button click."""
-        try:
-            self.scene_manager.start_animation(enable_profiling=True)
-            self._update_status("Animation started")
-        except Exception as e:
-            self._update_status(f"Error: {e}")
+        self.scene_manager.start_animation(enable_profiling=True)
+        self._update_status("Animation started")
     
+    @_handle
     def _on_stop_clicked(self):
         """Handle stop animation button click."""
-        try:
-            self.scene_manager.stop_animation()
-            self._update_status("Animation stopped")
-        except Exception as e:
-            self._update_status(f"Error: {e}")
+        self.scene_manager.stop_animation()
+        self._update_status("Animation stopped")
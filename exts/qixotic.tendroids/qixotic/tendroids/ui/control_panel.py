@@ -131,8 +131,14 @@ class V2ControlPanel:
         if self.scene_manager.bubble_manager:
             self.bubble_controls.set_bubble_manager(self.scene_manager.bubble_manager)
     
-    def update(self, dt: float):
-        """Per-frame update."""
+    def update(self, dt: float) -> bool:
+        """
+        Per-frame update.
+        
+        Returns:
+            True while a control binding is still pending; False once
+            everything is bound and further updates would be no-ops
+        """
         # Rebind if needed after spawning
         if self.scene_manager.animation_controller:
             if not self.wave_controls.wave_controller:
@@ -141,6 +147,11 @@ class V2ControlPanel:
         if self.scene_manager.bubble_manager:
             if not self.bubble_controls.bubble_manager:
                 self._bind_bubble_manager()
+        
+        return not (
+            self.wave_controls.wave_controller
+            and self.bubble_controls.bubble_manager
+        )
     
     def destroy(self):
         """Destroy the window."""
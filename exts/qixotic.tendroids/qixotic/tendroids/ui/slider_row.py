@@ -54,10 +54,16 @@ def create_int_slider_row(
         slider.model.set_value(value)
         
         value_label = ui.Label(str(value), width=value_width)
+        shown_text = str(value)
         
         def _on_changed(model):
+            nonlocal shown_text
             v = model.get_value_as_int()
-            value_label.text = str(v)
+            text = str(v)
+            # Label writes re-layout the widget; skip them when unchanged
+            if text != shown_text:
+                value_label.text = text
+                shown_text = text
             on_change(v)
         
         slider.model.add_value_changed_fn(_on_changed)
@@ -107,10 +113,16 @@ def create_float_slider_row(
         slider.model.set_value(value)
         
         value_label = ui.Label(fmt.format(value), width=value_width)
+        shown_text = fmt.format(value)
         
         def _on_changed(model):
+            nonlocal shown_text
             v = model.get_value_as_float()
-            value_label.text = fmt.format(v)
+            # Drags below display precision format to the same text
+            text = fmt.format(v)
+            if text != shown_text:
+                value_label.text = text
+                shown_text = text
             on_change(v)
         
         slider.model.add_value_changed_fn(_on_changed)
@@ -5,6 +5,8 @@ Provides helper functions for working with Fabric-backed USD attributes
 and USDRT stage access for zero-copy GPU operations.
 """
 
+import functools
+
 import carb
 
 
@@ -19,6 +21,19 @@ class FabricHelper:
     _cached_stage = None
     _cached_stage_id = None
     
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_usdrt_vt():
+        """
+        Get the usdrt.Vt module, resolved once per process.
+        
+        usdrt is only present inside Kit, so it cannot be imported at
+        module level; per-frame write paths call this instead of
+        repeating the import.
+        """
+        from usdrt import Vt
+        return Vt
+    
     @staticmethod
     def get_usdrt_stage(stage_id):
         """
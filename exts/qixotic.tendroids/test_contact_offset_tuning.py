@@ -17,7 +17,11 @@ Usage:
         - P: Print current values
 """
 
+import sys
+import time
+
 import omni.usd
+import omni.kit.app
 import carb.input
 from pxr import Gf
 
@@ -41,6 +45,21 @@ CREATURE_PATH = "/World/Creature"
 OFFSET_STEP = 0.01  # 1cm per keypress
 MIN_OFFSET = 0.001  # 1mm minimum
 MAX_OFFSET = 0.5    # 50cm maximum
+ACTION_DEBOUNCE = 0.1  # seconds; drops auto-repeat of V/R/P
+
+_RULE = "=" * 50
+
+# Static part of the P banner, built once
+_CONTROLS_HELP = "\n".join([
+    _RULE,
+    "Controls:",
+    "  UP/DOWN    - Adjust contact offset",
+    "  LEFT/RIGHT - Adjust rest offset",
+    "  V          - Toggle visibility",
+    "  R          - Reset to defaults",
+    "  P          - Print values",
+    _RULE,
+])
 
 
 # =============================================================================
@@ -52,7 +71,14 @@ class TuningState:
     contact_offset = CONTACT_OFFSET
     rest_offset = REST_OFFSET
     collider_visible = True
+    written_visible = None  # last value sent to set_collider_visibility
     subscription = None
+    stage = None
+    stage_event_subscription = None
+    update_subscription = None
+    pending_contact_delta = 0.0
+    pending_rest_delta = 0.0
+    last_action = {}  # key -> time of its last accepted press
 
 
 state = TuningState()
@@ -62,75 +88,135 @@ state = TuningState()
 # Functions
 # =============================================================================
 
+def _get_stage():
+    """Return the cached stage, resolving it once after start or a stage change."""
+    if state.stage is None:
+        state.stage = omni.usd.get_context().get_stage()
+    return state.stage
+
+
+def _on_stage_event(event):
+    """Drop the cached stage when a stage is opened or closed."""
+    if event.type in (
+        int(omni.usd.StageEventType.OPENED),
+        int(omni.usd.StageEventType.CLOSED),
+    ):
+        state.stage = None
+
+
 def print_current_values():
     """Print current offset values to console."""
-    stage = omni.usd.get_context().get_stage()
+    # Include arrow presses still queued for the next app update
+    apply_pending_offsets()
+    stage = _get_stage()
     values = get_contact_offsets(stage, CREATURE_PATH)
     
     if values:
-        print(f"\n{'='*50}")
-        print("CONTACT OFFSET TUNING")
-        print(f"{'='*50}")
-        print(f"  Contact Offset: {values['contact_offset']:.4f} m ({values['contact_offset']*100:.2f} cm)")
-        print(f"  Rest Offset:    {values['rest_offset']:.4f} m ({values['rest_offset']*100:.2f} cm)")
-        print(f"  Difference:     {(values['contact_offset'] - values['rest_offset']):.4f} m")
-        print(f"{'='*50}")
-        print("Controls:")
-        print("  UP/DOWN    - Adjust contact offset")
-        print("  LEFT/RIGHT - Adjust rest offset")
-        print("  V          - Toggle visibility")
-        print("  R          - Reset to defaults")
-        print("  P          - Print values")
-        print(f"{'='*50}\n")
+        contact = values['contact_offset']
+        rest = values['rest_offset']
+        # One write for the whole banner instead of a print per line
+        sys.stdout.write("\n".join([
+            "",
+            _RULE,
+            "CONTACT OFFSET TUNING",
+            _RULE,
+            f"  Contact Offset: {contact:.4f} m ({contact*100:.2f} cm)",
+            f"  Rest Offset:    {rest:.4f} m ({rest*100:.2f} cm)",
+            f"  Difference:     {(contact - rest):.4f} m",
+            _CONTROLS_HELP,
+            "",
+            "",
+        ]))
+        sys.stdout.flush()
     else:
         print("[ERROR] Could not get contact offset values")
 
 
 def adjust_contact_offset(delta: float):
-    """Adjust contact offset by delta."""
-    stage = omni.usd.get_context().get_stage()
-    
-    new_value = state.contact_offset + delta
-    new_value = max(MIN_OFFSET, min(MAX_OFFSET, new_value))
-    
-    # Ensure contact >= rest
-    if new_value < state.rest_offset:
-        print(f"[WARN] Contact offset cannot be less than rest offset ({state.rest_offset})")
-        new_value = state.rest_offset
-    
-    if update_contact_offsets(stage, CREATURE_PATH, contact_offset=new_value):
-        state.contact_offset = new_value
-        print(f"Contact Offset: {new_value:.4f} m ({new_value*100:.2f} cm)")
+    """Queue a contact offset change; applied on the next app update."""
+    state.pending_contact_delta += delta
 
 
 def adjust_rest_offset(delta: float):
-    """Adjust rest offset by delta."""
-    stage = omni.usd.get_context().get_stage()
+    """Queue a rest offset change; applied on the next app update."""
+    state.pending_rest_delta += delta
+
+
+def apply_pending_offsets():
+    """Apply queued offset deltas with a single USD write."""
+    if not state.pending_contact_delta and not state.pending_rest_delta:
+        return
+    
+    contact = state.contact_offset
+    rest = state.rest_offset
+    
+    if state.pending_contact_delta:
+        contact = max(MIN_OFFSET, min(MAX_OFFSET, contact + state.pending_contact_delta))
+        # Ensure contact >= rest
+        if contact < rest:
+            print(f"[WARN] Contact offset cannot be less than rest offset ({rest})")
+            contact = rest
+    
+    if state.pending_rest_delta:
+        rest = max(MIN_OFFSET, min(MAX_OFFSET, rest + state.pending_rest_delta))
+        # Ensure rest <= contact
+        if rest > contact:
+            print(f"[WARN] Rest offset cannot exceed contact offset ({contact})")
+            rest = contact
     
-    new_value = state.rest_offset + delta
-    new_value = max(MIN_OFFSET, min(MAX_OFFSET, new_value))
+    state.pending_contact_delta = 0.0
+    state.pending_rest_delta = 0.0
     
-    # Ensure rest <= contact
-    if new_value > state.contact_offset:
-        print(f"[WARN] Rest offset cannot exceed contact offset ({state.contact_offset})")
-        new_value = state.contact_offset
+    # Clamping can pin a value (e.g. UP held at MAX_OFFSET): skip no-op writes
+    contact_changed = abs(contact - state.contact_offset) > 1e-9
+    rest_changed = abs(rest - state.rest_offset) > 1e-9
+    if not contact_changed and not rest_changed:
+        return
     
-    if update_contact_offsets(stage, CREATURE_PATH, rest_offset=new_value):
-        state.rest_offset = new_value
-        print(f"Rest Offset: {new_value:.4f} m ({new_value*100:.2f} cm)")
+    if update_contact_offsets(
+        _get_stage(), CREATURE_PATH,
+        contact_offset=contact if contact_changed else None,
+        rest_offset=rest if rest_changed else None,
+    ):
+        if contact_changed:
+            state.contact_offset = contact
+            print(f"Contact Offset: {contact:.4f} m ({contact*100:.2f} cm)")
+        if rest_changed:
+            state.rest_offset = rest
+            print(f"Rest Offset: {rest:.4f} m ({rest*100:.2f} cm)")
+
+
+def apply_pending_visibility():
+    """Write collider visibility only if it differs from the last write."""
+    if state.collider_visible == state.written_visible:
+        return
+    set_collider_visibility(_get_stage(), CREATURE_PATH, state.collider_visible)
+    state.written_visible = state.collider_visible
+
+
+def _on_update(event):
+    """Flush key-driven changes once per frame."""
+    apply_pending_offsets()
+    apply_pending_visibility()
 
 
 def toggle_visibility():
-    """Toggle collider visibility."""
-    stage = omni.usd.get_context().get_stage()
+    """Toggle collider visibility; written on the next app update."""
     state.collider_visible = not state.collider_visible
-    set_collider_visibility(stage, CREATURE_PATH, state.collider_visible)
     print(f"Collider visibility: {'ON' if state.collider_visible else 'OFF'}")
 
 
 def reset_to_defaults():
     """Reset offsets to default values."""
-    stage = omni.usd.get_context().get_stage()
+    # Queued arrow presses predate the reset; don't apply them on top of it
+    state.pending_contact_delta = 0.0
+    state.pending_rest_delta = 0.0
+    
+    if state.contact_offset == CONTACT_OFFSET and state.rest_offset == REST_OFFSET:
+        print(f"Already at defaults: contact={CONTACT_OFFSET}, rest={REST_OFFSET}")
+        return
+    
+    stage = _get_stage()
     
     if update_contact_offsets(stage, CREATURE_PATH, 
                               contact_offset=CONTACT_OFFSET,
@@ -140,6 +226,15 @@ def reset_to_defaults():
         print(f"Reset to defaults: contact={CONTACT_OFFSET}, rest={REST_OFFSET}")
 
 
+def _debounced(key) -> bool:
+    """True if this action key fired too soon after its own previous press."""
+    now = time.monotonic()
+    if now - state.last_action.get(key, 0.0) < ACTION_DEBOUNCE:
+        return True
+    state.last_action[key] = now
+    return False
+
+
 def on_key_event(event):
     """Handle keyboard input for tuning."""
     if event.type == carb.input.KeyboardEventType.KEY_PRESS:
@@ -154,21 +249,30 @@ def on_key_event(event):
         elif key == carb.input.KeyboardInput.LEFT:
             adjust_rest_offset(-OFFSET_STEP)
         elif key == carb.input.KeyboardInput.V:
-            toggle_visibility()
+            if not _debounced(key):
+                toggle_visibility()
         elif key == carb.input.KeyboardInput.R:
-            reset_to_defaults()
+            if not _debounced(key):
+                reset_to_defaults()
         elif key == carb.input.KeyboardInput.P:
-            print_current_values()
+            if not _debounced(key):
+                print_current_values()
 
 
 def start_tuning():
     """Start the contact offset tuning mode."""
-    print("\n" + "="*60)
-    print("CONTACT OFFSET VISUAL TUNING - STARTED")
-    print("="*60)
+    print("\n" + "="*60 + "\nCONTACT OFFSET VISUAL TUNING - STARTED\n" + "="*60)
+    
+    # Resolve the stage once; key handlers reuse it until the stage changes
+    state.stage = omni.usd.get_context().get_stage()
+    if state.stage_event_subscription is None:
+        events = omni.usd.get_context().get_stage_event_stream()
+        state.stage_event_subscription = events.create_subscription_to_pop(
+            _on_stage_event, name="ContactOffsetTuning.StageEvents"
+        )
     
     # Initialize state from current values
-    stage = omni.usd.get_context().get_stage()
+    stage = state.stage
     values = get_contact_offsets(stage, CREATURE_PATH)
     if values:
         state.contact_offset = values['contact_offset']
@@ -176,7 +280,7 @@ def start_tuning():
     
     # Make collider visible for tuning
     set_collider_visibility(stage, CREATURE_PATH, True)
-    state.collider_visible = True
+    state.collider_visible = state.written_visible = True
     
     # Subscribe to keyboard input
     input_iface = carb.input.acquire_input_interface()
@@ -185,9 +289,15 @@ def start_tuning():
         keyboard, on_key_event
     )
     
+    # Held arrow keys only accumulate deltas; USD is written once per frame
+    if state.update_subscription is None:
+        update_stream = omni.kit.app.get_app().get_update_event_stream()
+        state.update_subscription = update_stream.create_subscription_to_pop(
+            _on_update, name="ContactOffsetTuning.Update"
+        )
+    
     print_current_values()
-    print("\nTuning mode active. Use arrow keys to adjust.")
-    print("Run stop_tuning() to exit.\n")
+    print("\nTuning mode active. Use arrow keys to adjust.\nRun stop_tuning() to exit.\n")
 
 
 def stop_tuning():
@@ -200,8 +310,21 @@ def stop_tuning():
         )
         state.subscription = None
     
+    if state.update_subscription:
+        state.update_subscription.unsubscribe()
+        state.update_subscription = None
+    # Don't drop presses that arrived after the last frame
+    apply_pending_offsets()
+    apply_pending_visibility()
+    
     print("\nTuning mode stopped.")
     print_current_values()
+    
+    if state.stage_event_subscription:
+        state.stage_event_subscription.unsubscribe()
+        state.stage_event_subscription = None
+    state.stage = None
+    state.written_visible = None
 
 
 # =============================================================================
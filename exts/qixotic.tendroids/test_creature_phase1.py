@@ -12,9 +12,11 @@ from qixotic.tendroids.scene import V2SceneManager
 
 
 # Create scene manager
-carb.log_info("=" * 60)
-carb.log_info("Creating Tendroids scene with interactive creature...")
-carb.log_info("=" * 60)
+carb.log_info("\n".join([
+    "=" * 60,
+    "Creating Tendroids scene with interactive creature...",
+    "=" * 60,
+]))
 
 manager = V2SceneManager()
 
@@ -26,33 +28,36 @@ success = manager.create_tendroids(
 )
 
 if success:
-    carb.log_info("✅ Scene created successfully")
-    carb.log_info(f"   Tendroids: {manager.get_tendroid_count()}")
+    carb.log_info(
+        f"✅ Scene created successfully\n   Tendroids: {manager.get_tendroid_count()}"
+    )
     
     # Start animation with profiling
     manager.start_animation(enable_profiling=True)
     carb.log_info("✅ Animation started with profiling")
     
-    # Print instructions
-    carb.log_info("")
-    carb.log_info("🎮 CREATURE CONTROLS (KEYBOARD):")
-    carb.log_info("   W or Up Arrow:    Move forward (Z-)")
-    carb.log_info("   S or Down Arrow:  Move backward (Z+)")
-    carb.log_info("   A or Left Arrow:  Move left (X-)")
-    carb.log_info("   D or Right Arrow: Move right (X+)")
-    carb.log_info("   Space:            Move up (Y+)")
-    carb.log_info("   Left Shift:       Move down (Y-)")
-    carb.log_info("")
-    carb.log_info("   Note: Mouse is free for camera control!")
-    carb.log_info("")
-    carb.log_info("📊 MONITORING:")
-    carb.log_info("   FPS will be logged every second")
-    carb.log_info("   Look for cyan cylinder creature in scene")
-    carb.log_info("")
-    carb.log_info("🛑 TO STOP:")
-    carb.log_info("   manager.stop_animation()")
-    carb.log_info("   manager.clear_tendroids()")
-    carb.log_info("")
+    # Print instructions (one log call for the whole block)
+    carb.log_info("\n".join([
+        "",
+        "🎮 CREATURE CONTROLS (KEYBOARD):",
+        "   W or Up Arrow:    Move forward (Z-)",
+        "   S or Down Arrow:  Move backward (Z+)",
+        "   A or Left Arrow:  Move left (X-)",
+        "   D or Right Arrow: Move right (X+)",
+        "   Space:            Move up (Y+)",
+        "   Left Shift:       Move down (Y-)",
+        "",
+        "   Note: Mouse is free for camera control!",
+        "",
+        "📊 MONITORING:",
+        "   FPS will be logged every second",
+        "   Look for cyan cylinder creature in scene",
+        "",
+        "🛑 TO STOP:",
+        "   manager.stop_animation()",
+        "   manager.clear_tendroids()",
+        "",
+    ]))
 else:
     carb.log_error("❌ Failed to create scene")
 
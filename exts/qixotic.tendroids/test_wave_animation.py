@@ -38,12 +38,16 @@ def run_test(count: int = 5):
         print("[WaveTest] ERROR: Failed to create tendroids")
         return
     
-    print(f"[WaveTest] Created {_test_manager.get_tendroid_count()} tendroids")
-    print("[WaveTest] Starting animation with profiling...")
+    print(
+        f"[WaveTest] Created {_test_manager.get_tendroid_count()} tendroids\n"
+        "[WaveTest] Starting animation with profiling..."
+    )
     
     _test_manager.start_animation(enable_profiling=True)
-    print("[WaveTest] Animation running - watch tendroids sway!")
-    print("[WaveTest] Run stop_test() to stop")
+    print(
+        "[WaveTest] Animation running - watch tendroids sway!\n"
+        "[WaveTest] Run stop_test() to stop"
+    )
 
 
 def stop_test():
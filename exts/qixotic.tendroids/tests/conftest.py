@@ -38,24 +38,25 @@ class MockModule(ModuleType):
     return mock
 
 
-def install_mock_module(name: str) -> MockModule:
-  """Install a mock module and all its parent packages."""
-  parts = name.split('.')
-
-  # Install all parent packages first
-  for i in range(len(parts)):
-    partial_name = '.'.join(parts[:i + 1])
-    if partial_name not in sys.modules:
-      mock = MockModule(partial_name)
-      sys.modules[partial_name] = mock
-
-      # Link child to parent
-      if i > 0:
-        parent_name = '.'.join(parts[:i])
-        parent = sys.modules[parent_name]
-        setattr(parent, parts[i], mock)
+def install_mock_modules(names) -> None:
+  """Install mock modules and all their parent packages in one batch."""
+  # Every dotted prefix, parents before children, without duplicates
+  closure = {}
+  for name in names:
+    parts = name.split('.')
+    for i in range(1, len(parts) + 1):
+      closure['.'.join(parts[:i])] = None
+
+  mocks = {
+    name: MockModule(name) for name in closure if name not in sys.modules
+  }
+  sys.modules.update(mocks)
 
-  return sys.modules[name]
+  # Link each new child to its parent package
+  for name, mock in mocks.items():
+    parent_name, _, child = name.rpartition('.')
+    if parent_name:
+      setattr(sys.modules[parent_name], child, mock)
 
 
 # Comprehensive list of omni modules used in the extension
@@ -91,16 +92,6 @@ omni_modules = [
   'omni.usd.libs',
 ]
 
-# Install all omni modules
-for name in omni_modules:
-  install_mock_module(name)
-
-# Set up omni.ext.IExt as a proper base class
-sys.modules['omni.ext'].IExt = type('IExt', (), {
-  'on_startup': lambda self, ext_id: None,
-  'on_shutdown': lambda self: None,
-})
-
 # Mock carb (Carbonite logging)
 carb_modules = [
   'carb',
@@ -109,13 +100,6 @@ carb_modules = [
   'carb.input',
   'carb.events',
 ]
-for name in carb_modules:
-  install_mock_module(name)
-
-# Set up carb logging functions
-sys.modules['carb'].log_info = MagicMock()
-sys.modules['carb'].log_warn = MagicMock()
-sys.modules['carb'].log_error = MagicMock()
 
 # Mock pxr (Pixar USD)
 pxr_modules = [
@@ -130,12 +114,23 @@ pxr_modules = [
   'pxr.Vt',
   'pxr.Tf',
 ]
-for name in pxr_modules:
-  install_mock_module(name)
 
-# Mock PhysxSchema
-install_mock_module('PhysxSchema')
-install_mock_module('physxSchema')
+# Already installed when conftest is re-imported in the same process
+if 'omni' not in sys.modules:
+  install_mock_modules(
+    omni_modules + carb_modules + pxr_modules + ['PhysxSchema', 'physxSchema']
+  )
+
+  # Set up omni.ext.IExt as a proper base class
+  sys.modules['omni.ext'].IExt = type('IExt', (), {
+    'on_startup': lambda self, ext_id: None,
+    'on_shutdown': lambda self: None,
+  })
+
+  # Set up carb logging functions
+  sys.modules['carb'].log_info = MagicMock()
+  sys.modules['carb'].log_warn = MagicMock()
+  sys.modules['carb'].log_error = MagicMock()
 
 # Add extension source to path for imports
 ext_root = Path(__file__).parent.parent
@@ -182,7 +177,7 @@ def mock_stage_with_creature(mock_stage):
   return mock_stage
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_vec3f():
   """Factory fixture for creating MockVec3f instances."""
 
@@ -229,7 +224,7 @@ def tendroid_positions():
   ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def envelope_params():
   """Expected envelope parameters from TEND-11 design."""
   return {
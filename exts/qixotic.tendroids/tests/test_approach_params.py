@@ -17,14 +17,19 @@ from unittest.mock import MagicMock
 sys.modules['warp'] = MagicMock()
 sys.modules['carb'] = MagicMock()
 
+from qixotic.tendroids.proximity import (
+    ApproachParameters,
+    DEFAULT_APPROACH_PARAMS,
+    create_custom_approach_params,
+    get_approach_params,
+)
+
 
 class TestApproachParameters(unittest.TestCase):
     """Test ApproachParameters dataclass."""
     
     def test_default_values(self):
         """TEND-68, TEND-69: Test default parameter values."""
-        from qixotic.tendroids.proximity import ApproachParameters
-        
         params = ApproachParameters()
         
         # TEND-68: approach_epsilon default
@@ -39,8 +44,6 @@ class TestApproachParameters(unittest.TestCase):
     
     def test_validation_valid(self):
         """Test valid configuration passes validation."""
-        from qixotic.tendroids.proximity import ApproachParameters
-        
         params = ApproachParameters()
         valid, msg = params.validate()
         
@@ -49,8 +52,6 @@ class TestApproachParameters(unittest.TestCase):
     
     def test_validation_epsilon_zero(self):
         """Test epsilon=0 fails validation."""
-        from qixotic.tendroids.proximity import ApproachParameters
-        
         params = ApproachParameters(approach_epsilon=0)
         valid, msg = params.validate()
         
@@ -59,8 +60,6 @@ class TestApproachParameters(unittest.TestCase):
     
     def test_validation_minimum_less_than_epsilon(self):
         """Test minimum < epsilon fails validation."""
-        from qixotic.tendroids.proximity import ApproachParameters
-        
         params = ApproachParameters(
             approach_epsilon=0.10,
             approach_minimum=0.05
@@ -72,8 +71,6 @@ class TestApproachParameters(unittest.TestCase):
     
     def test_validation_warning_less_than_minimum(self):
         """Test warning < minimum fails validation."""
-        from qixotic.tendroids.proximity import ApproachParameters
-        
         params = ApproachParameters(
             approach_minimum=0.30,
             warning_distance=0.20
@@ -84,8 +81,6 @@ class TestApproachParameters(unittest.TestCase):
     
     def test_to_centimeters(self):
         """Test conversion to centimeters."""
-        from qixotic.tendroids.proximity import ApproachParameters
-        
         params = ApproachParameters(
             approach_epsilon=0.05,
             approach_minimum=0.10,
@@ -104,9 +99,10 @@ class TestApproachParameters(unittest.TestCase):
 class TestZoneClassification(unittest.TestCase):
     """Test zone classification based on distance."""
     
-    def setUp(self):
-        from qixotic.tendroids.proximity import ApproachParameters
-        self.params = ApproachParameters(
+    @classmethod
+    def setUpClass(cls):
+        # Read-only for every test in this class
+        cls.params = ApproachParameters(
             approach_epsilon=0.04,
             approach_minimum=0.15,
             warning_distance=0.25,
@@ -148,15 +144,11 @@ class TestApproachPresets(unittest.TestCase):
     
     def test_preset_default(self):
         """Test default preset."""
-        from qixotic.tendroids.proximity import get_approach_params
-        
         params = get_approach_params("default")
         self.assertEqual(params.approach_epsilon, 0.04)
     
     def test_preset_small_creature(self):
         """Test small creature preset has tighter tolerances."""
-        from qixotic.tendroids.proximity import get_approach_params
-        
         params = get_approach_params("small_creature")
         default = get_approach_params("default")
         
@@ -165,8 +157,6 @@ class TestApproachPresets(unittest.TestCase):
     
     def test_preset_large_creature(self):
         """Test large creature preset has larger tolerances."""
-        from qixotic.tendroids.proximity import get_approach_params
-        
         params = get_approach_params("large_creature")
         default = get_approach_params("default")
         
@@ -175,15 +165,11 @@ class TestApproachPresets(unittest.TestCase):
     
     def test_preset_none_returns_default(self):
         """Test None returns default config."""
-        from qixotic.tendroids.proximity import get_approach_params, DEFAULT_APPROACH_PARAMS
-        
         params = get_approach_params(None)
         self.assertEqual(params.approach_epsilon, DEFAULT_APPROACH_PARAMS.approach_epsilon)
     
     def test_preset_unknown_returns_default(self):
         """Test unknown preset returns default."""
-        from qixotic.tendroids.proximity import get_approach_params, DEFAULT_APPROACH_PARAMS
-        
         params = get_approach_params("nonexistent")
         self.assertEqual(params.approach_epsilon, DEFAULT_APPROACH_PARAMS.approach_epsilon)
 
@@ -193,8 +179,6 @@ class TestCustomParams(unittest.TestCase):
     
     def test_create_from_centimeters(self):
         """Test creating params from centimeter values."""
-        from qixotic.tendroids.proximity import create_custom_approach_params
-        
         params = create_custom_approach_params(
             epsilon_cm=5.0,
             minimum_cm=15.0,
@@ -209,8 +193,6 @@ class TestCustomParams(unittest.TestCase):
     
     def test_create_invalid_raises(self):
         """Test invalid params raise ValueError."""
-        from qixotic.tendroids.proximity import create_custom_approach_params
-        
         with self.assertRaises(ValueError):
             create_custom_approach_params(
                 epsilon_cm=20.0,  # Larger than minimum!
@@ -225,8 +207,6 @@ class TestPhysXAlignment(unittest.TestCase):
     
     def test_epsilon_matches_physx_contact_offset(self):
         """Verify approach_epsilon matches PhysX contactOffset."""
-        from qixotic.tendroids.proximity import DEFAULT_APPROACH_PARAMS
-        
         # PhysX contactOffset is 4cm (set in TEND-13)
         PHYSX_CONTACT_OFFSET = 0.04
         
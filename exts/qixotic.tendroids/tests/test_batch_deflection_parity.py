@@ -0,0 +1,154 @@
+"""
+Parity tests for BatchDeflectionManager
+
+The Warp step kernel (batch_deflection_step_kernel) must match the
+vectorized NumPy path. Warp runs on device="cpu", so both paths are
+compared here without a GPU.
+"""
+
+import importlib
+import sys
+from types import ModuleType
+
+import pytest
+
+
+MANAGER_MODULE = 'qixotic.tendroids.deflection.batch_deflection_manager'
+KERNEL_MODULE = 'qixotic.tendroids.deflection.warp_deflection_kernel'
+
+# float32 kernel vs float64 NumPy
+TOLERANCE = 1e-5
+
+
+class _Tendroid:
+    """Minimal tendroid with the attributes register_tendroids reads."""
+
+    def __init__(self, position, length, radius=0.05):
+        self.position = position
+        self.length = length
+        self.radius = radius
+
+
+def _is_real_module(module) -> bool:
+    return isinstance(module, ModuleType) and getattr(module, '__file__', None)
+
+
+@pytest.fixture
+def manager_module(monkeypatch):
+    """
+    batch_deflection_manager imported against the real Warp package.
+
+    Several test modules stub sys.modules['warp'] at import time, so the
+    manager and kernel modules are re-imported here; monkeypatch puts the
+    stubs and the original modules back afterwards.
+    """
+    if not _is_real_module(sys.modules.get('warp')):
+        monkeypatch.delitem(sys.modules, 'warp', raising=False)
+    wp = pytest.importorskip('warp')
+    if not _is_real_module(wp):
+        pytest.skip("Warp not installed")
+
+    package = importlib.import_module('qixotic.tendroids.deflection')
+    for name in (KERNEL_MODULE, MANAGER_MODULE):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+        attr = name.rsplit('.', 1)[1]
+        monkeypatch.setattr(package, attr, getattr(package, attr, None), raising=False)
+
+    module = importlib.import_module(MANAGER_MODULE)
+    assert module.WARP_AVAILABLE
+    return module
+
+
+def _make_managers(module, tendroids):
+    """A NumPy-path manager and a Warp-kernel manager over the same tendroids."""
+    cpu = module.BatchDeflectionManager(device="cpu")
+    cpu.register_tendroids(tendroids)
+
+    # Warp arrays on the CPU device: same kernel code as on CUDA
+    gpu = module.BatchDeflectionManager(device="cpu")
+    gpu._tendroid_count = len(tendroids)
+    gpu._build_gpu_arrays(
+        [t.position[0] for t in tendroids],
+        [t.position[2] for t in tendroids],
+        [t.position[1] for t in tendroids],
+        [t.length for t in tendroids],
+        [t.radius for t in tendroids],
+    )
+    gpu._built = True
+    return cpu, gpu
+
+
+def _assert_step_matches(cpu, gpu, creature_pos, dt=1.0 / 60.0):
+    cpu_angles, cpu_axes = cpu._compute_cpu(creature_pos, (0.0, 0.0, 0.0), dt)
+    gpu_angles, gpu_axes = gpu._compute_gpu(creature_pos, (0.0, 0.0, 0.0), dt)
+
+    assert gpu_angles == pytest.approx(cpu_angles, abs=TOLERANCE)
+    for cpu_axis, gpu_axis in zip(cpu_axes, gpu_axes):
+        assert gpu_axis == pytest.approx(cpu_axis, abs=TOLERANCE)
+    return cpu_angles
+
+
+# =============================================================================
+# Parity Tests
+# =============================================================================
+
+class TestBatchDeflectionParity:
+    """Warp step kernel vs vectorized NumPy path."""
+
+    def test_moving_creature_matches(self, manager_module):
+        """A creature sweeping through the field deflects and recovers identically."""
+        tendroids = [
+            _Tendroid((x * 0.4, (x % 3) * 0.05, z * 0.4), 1.0 + 0.25 * (z % 2))
+            for x in range(-3, 4)
+            for z in range(-3, 4)
+        ]
+        cpu, gpu = _make_managers(manager_module, tendroids)
+
+        deflected = False
+        for frame in range(240):
+            t = frame / 240.0
+            pos = (-1.6 + 3.2 * t, 0.2 + 0.6 * t, 0.3 - 0.6 * t)
+            angles = _assert_step_matches(cpu, gpu, pos)
+            deflected = deflected or max(angles) > 0.0
+
+        # Then leave the field: everything recovers the same way
+        for _ in range(120):
+            _assert_step_matches(cpu, gpu, (10.0, 0.5, 10.0))
+
+        assert deflected
+
+    def test_in_range_and_out_of_range(self, manager_module):
+        """Only the tendroid within detection range deflects, on both paths."""
+        near = _Tendroid((0.0, 0.0, 0.0), 1.0)
+        far = _Tendroid((5.0, 0.0, 5.0), 1.0)
+        cpu, gpu = _make_managers(manager_module, [near, far])
+
+        for _ in range(30):
+            angles = _assert_step_matches(cpu, gpu, (0.2, 0.5, 0.1))
+
+        assert angles[0] > 0.0
+        assert angles[1] == 0.0
+
+    def test_out_of_height_span(self, manager_module):
+        """A creature above the tip or below the base is ignored on both paths."""
+        cpu, gpu = _make_managers(manager_module, [_Tendroid((0.0, 0.0, 0.0), 1.0)])
+
+        for pos in ((0.1, 1.5, 0.0), (0.1, -0.5, 0.0)):
+            angles = _assert_step_matches(cpu, gpu, pos)
+            assert angles == [0.0]
+
+    def test_zero_height_tendroid(self, manager_module):
+        """Zero-height tendroids use a height ratio of 0 instead of dividing by zero."""
+        tendroids = [
+            _Tendroid((0.0, 0.0, 0.0), 0.0),
+            _Tendroid((0.3, 0.0, 0.0), 1.0),
+        ]
+        cpu, gpu = _make_managers(manager_module, tendroids)
+
+        # Level with the flat tendroid's base: it is in its (empty) span
+        for _ in range(10):
+            angles = _assert_step_matches(cpu, gpu, (0.1, 0.0, 0.05))
+        assert angles[0] > 0.0
+
+        for _ in range(10):
+            _assert_step_matches(cpu, gpu, (0.1, 0.4, 0.05))
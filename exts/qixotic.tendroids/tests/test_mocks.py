@@ -100,14 +100,14 @@ class MockStage:
     self.removed_prims: List[str] = []
 
   def GetPrimAtPath(self, path: str) -> MockPrim:
-    if path in self.prims:
-      return self.prims[path]
-    # Return invalid prim
+    prim = self.prims.get(path)
+    if prim is not None:
+      return prim
+    # Return invalid prim (keeps the queried path, like USD)
     return MockPrim(path=path, valid=False)
 
   def RemovePrim(self, path: str):
-    if path in self.prims:
-      del self.prims[path]
+    self.prims.pop(path, None)
     self.removed_prims.append(path)
 
   def DefinePrim(self, path: str, prim_type: str = "Xform") -> MockPrim: